@@ -0,0 +1,8 @@
+# Puts the repository root on sys.path, so the scripts in this folder can
+# import the mancala_engine package when run as `python aiVSai/<script>.py`
+import os
+import sys
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
@@ -0,0 +1,150 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+import _engine_path  # noqa: F401
+from mancala_engine import Game, Play, SLOT_KEYS
+
+POSITIONS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bench_positions.json')
+SEARCH_DEPTHS = (4, 6, 8)
+
+
+def load_positions(path=POSITIONS_PATH):
+    with open(path) as f:
+        return json.load(f)['positions']
+
+
+def position_game(position, game=None):
+    # A Game whose computer is the side to move in `position`, set to that position
+    if game is None:
+        game = Game(human_side='G', computer_side='A') if position['side'] == 1 else Game(human_side='A', computer_side='G')
+    game.state.board = dict(zip(SLOT_KEYS, position['slots']))
+    return game
+
+
+def _rate(operation, calls, repeat, min_time):
+    # Best calls per second over `repeat` runs of at least `min_time` seconds each
+    best = 0.0
+    for _ in range(repeat):
+        rounds = 0
+        start = time.perf_counter()
+        while True:
+            operation()
+            rounds += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        best = max(best, rounds * calls / elapsed)
+    return best
+
+
+def run_benchmarks(positions, heuristic='ai2', repeat=3, min_time=0.2, depths=SEARCH_DEPTHS):
+    """Metrics over the position set; `*_per_sec` are rates, the rest time (s) and node counts"""
+    games = [position_game(position) for position in positions]
+    moves = [(game, slot) for game in games for slot in game.state.legal_slots(game.side(1))]
+
+    def do_moves():
+        for game, slot in moves:
+            game.undoMove(game.doMove(slot))
+
+    def generate_moves():
+        for game in games:
+            game.state.legal_slots(game.side(1))
+
+    def evaluate_ai1():
+        for game in games:
+            game.evaluate_ai1()
+
+    def evaluate_ai2():
+        for game in games:
+            game.evaluate_ai2()
+
+    metrics = {
+        'do_move_per_sec': _rate(do_moves, len(moves), repeat, min_time),
+        'movegen_per_sec': _rate(generate_moves, len(games), repeat, min_time),
+        'evaluate_ai1_per_sec': _rate(evaluate_ai1, len(games), repeat, min_time),
+        'evaluate_ai2_per_sec': _rate(evaluate_ai2, len(games), repeat, min_time),
+    }
+
+    # Fixed-depth searches from a fresh Play per position, so node counts are reproducible
+    for depth in depths:
+        best_time, nodes = None, 0
+        for _ in range(repeat):
+            elapsed, nodes = 0.0, 0
+            for position in positions:
+                play = Play()
+                game = position_game(position, play.game_ai1 if position['side'] == 1 else play.game_ai2)
+                start = time.perf_counter()
+                result = play.search(game, heuristic, depth)
+                elapsed += time.perf_counter() - start
+                nodes += result.nodes
+            best_time = elapsed if best_time is None else min(best_time, elapsed)
+        metrics[f'search_d{depth}_time'] = best_time
+        metrics[f'search_d{depth}_nodes'] = nodes
+    return metrics
+
+
+def compare(metrics, baseline, threshold):
+    """Metrics worse than the baseline by more than `threshold` (a fraction)
+
+    Rates (`*_per_sec`) regress when they drop; times and node counts when they grow.
+    """
+    regressions = []
+    for name, old in baseline.items():
+        new = metrics.get(name)
+        if new is None or not old:
+            continue
+        change = (new - old) / old
+        if name.endswith('_per_sec'):
+            change = -change
+        if change > threshold:
+            regressions.append({'metric': name, 'baseline': old, 'current': new, 'change': change})
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the Mancala board, evaluators and search")
+    parser.add_argument("--positions", default=POSITIONS_PATH, help="position set (JSON)")
+    parser.add_argument("--heuristic", default="ai2", choices=["ai1", "ai2"], help="heuristic for the searches")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per metric; the best one counts")
+    parser.add_argument("--out", default=None, help="write the results as JSON")
+    parser.add_argument("--baseline", default=None, help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="allowed slowdown against the baseline, as a fraction (default: 0.10)")
+    parser.add_argument("--save-baseline", default=None, help="store these metrics as the new baseline")
+    args = parser.parse_args()
+
+    positions = load_positions(args.positions)
+    metrics = run_benchmarks(positions, args.heuristic, args.repeat)
+    for name, value in metrics.items():
+        if name.endswith('_time'):
+            print(f"{name:24} {value:14.3f} s")
+        else:
+            print(f"{name:24} {value:14,.0f}")
+
+    report = {
+        'metrics': metrics,
+        'positions': len(positions),
+        'heuristic': args.heuristic,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+    }
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        report['threshold'] = args.threshold
+        report['regressions'] = compare(metrics, baseline.get('metrics', baseline), args.threshold)
+        for regression in report['regressions']:
+            print(f"REGRESSION {regression['metric']}: {regression['baseline']:,.4g} -> "
+                  f"{regression['current']:,.4g} ({regression['change']:+.1%} worse)")
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump({'metrics': metrics}, f, indent=2)
+    if report.get('regressions'):
+        sys.exit(1)
@@ -1,10 +1,18 @@
+import argparse
+import os
 import pygame
 import sys
 import time
-from mancala_game import Play 
+
+import _engine_path  # noqa: F401
+from mancala_engine import Play, BackgroundSearch, GameRecord
 #works pretty well
 class MancalaGUI:
-    def __init__(self):
+    def __init__(self, workers=1, endgame_db=None, opening_book=None, fps=30, turbo=False,
+                 headless=False, frames_dir=None, record_path=None):
+        # headless: no window (SDL's dummy driver); frames_dir: save a PNG after every move
+        if headless:
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
         pygame.init()
 
         # Screen dimensions and setup
@@ -32,12 +40,29 @@ class MancalaGUI:
             self.wood_texture = None
 
         # Initialize Mancala game logic
-        self.game = Play()
+        # workers > 1: root-parallel search
+        self.game = Play(workers=workers, endgame_db=endgame_db, opening_book=opening_book)
+        # Searches run on a worker thread so the window keeps handling events
+        self.searcher = BackgroundSearch(self.game)
+        self.message = None  # Status line drawn above the board
         self.running = True
-        self.history = []  # To store the history of game states
-        self.current_index = -1
+        # The game so far (start position and moves), streamed to record_path if given
+        self.record = GameRecord(self.game.game_ai1.state.pack(1), out_path=record_path)
+        self.current_index = 0  # Ply shown on the board
         self.last_move = None  # Track the last move made
 
+        # Pacing: frames per second of the window loop, and the pauses between
+        # moves (none in turbo mode)
+        self.fps = fps
+        self.move_delay = 0.0 if turbo else 1.0
+        self.first_move_delay = 0.0 if turbo else 0.5
+        # Without a window the board is only drawn when frames are saved
+        self.headless = headless
+        self.frames_dir = frames_dir
+        self.frame_count = 0
+        if frames_dir:
+            os.makedirs(frames_dir, exist_ok=True)
+
         # Pit positioning
         self.pit_positions = {
             # AI 1's pits (bottom row)
@@ -65,7 +90,7 @@ class MancalaGUI:
                          (50, 150, self.screen_width - 100, 400), 4)
 
         # Draw pits and stores
-        board = self.history[self.current_index] if self.history else self.game.game_ai1.state.board
+        board = self.record.position(self.current_index)[0].board
         
         for pit, pos in self.pit_positions.items():
             # Determine pit color and size
@@ -109,53 +134,61 @@ class MancalaGUI:
         text_rect = text_surface.get_rect(center=(self.screen_width // 2, 100))
         self.screen.blit(text_surface, text_rect)
 
-    def ai_turn(self, ai_function, ai_name):
-        """Handles an AI's turn and updates the board."""
-        # Clear previous messages
-        self.screen.fill(self.bg_color if not self.wood_texture else (0,0,0), 
-                         (0, 50, self.screen_width, 100))
-        
-        self.draw_message(f"{ai_name} is thinking...")
-        pygame.display.flip()
-        time.sleep(0.5)  # Slight pause for visibility
-        # Store the last chosen move
-        if ai_name == "AI 1":
-            # Save the move before executing
-            self.last_move = self._get_best_move(self.game.MinimaxAlphaBetaPruning, 
-                                                 self.game.game_ai1, 
-                                                 'ai1')
-            # Execute AI's move
-            ai_function()
-        else:
-            # Save the move before executing
-            self.last_move = self._get_best_move(self.game.MinimaxAlphaBetaPruning, 
-                                                 self.game.game_ai2, 
-                                                 'ai2')
-            # Execute AI's move
-            ai_function()
-    
-
-        self.history.append(self.game.game_ai1.state.board.copy())  # Save state after move
+    def ai_player(self, ai_turn):
+        """(game, heuristic, depth, name) of the AI to move (1: AI 1, -1: AI 2)."""
+        if ai_turn == 1:
+            return self.game.game_ai1, 'ai1', self.game.ai1_depth, "AI 1"
+        return self.game.game_ai2, 'ai2', self.game.ai2_depth, "AI 2"
+
+    def start_ai_turn(self, ai_turn):
+        """Starts the AI's search in the background; the main loop polls it."""
+        game, ai_type, depth, ai_name = self.ai_player(ai_turn)
+        self.searcher.start(game, ai_type, depth)
+        self.message = f"{ai_name} is thinking..."
+        self.update_display()
+
+    def save_frame(self):
+        """Writes the screen to frames_dir as the next numbered PNG, if saving frames."""
+        if not self.frames_dir:
+            return
+        path = os.path.join(self.frames_dir, f"frame_{self.frame_count:04d}.png")
+        pygame.image.save(self.screen, path)
+        self.frame_count += 1
+
+    def show_progress(self, ai_turn):
+        """Shows how deep the running search has got, when that changes."""
+        if self.searcher.progress is None:
+            return
+        depth, _, pit, nodes = self.searcher.progress
+        message = f"{self.ai_player(ai_turn)[3]} is thinking... depth {depth}, best {pit} ({nodes} nodes)"
+        if message != self.message:
+            self.message = message
+            self.update_display()
+
+    def finish_ai_turn(self, ai_turn, result):
+        """Plays a finished search's move and updates the board."""
+        self.game.play_result(self.ai_player(ai_turn)[0], result)
+        self.last_move = result.move
+        self.message = None
+
+        self.record.append(result.move)  # Save the move
         self.current_index += 1
 
         # Update the display with the new state
         self.update_display()
-        time.sleep(0.5)  # Pause after move for clarity
-
-    def _get_best_move(self, minimax_func, game, ai_type):
-        """Helper method to get the best move without executing it."""
-        _, best_move = minimax_func(
-            game, 1, depth=6, alpha=-float('inf'), beta=float('inf'), ai_type=ai_type
-        )
-        return best_move
+        self.save_frame()
 
     def update_display(self):
+        if self.headless and not self.frames_dir:
+            return  # Nobody will see it
         if self.wood_texture:
             self.screen.blit(self.wood_texture, (0, 0))
         else:
             self.screen.fill(self.bg_color)
         
         self.draw_board()
+        if self.message:
+            self.draw_message(self.message)
         pygame.display.flip()
 
     def handle_navigation(self, event):
@@ -164,34 +197,44 @@ class MancalaGUI:
                 self.current_index -= 1
                 self.update_display()
         elif event.key == pygame.K_RIGHT:  # Forward
-            if self.current_index < len(self.history) - 1:
+            if self.current_index < len(self.record) - 1:
                 self.current_index += 1
                 self.update_display()
-
-    def display_winner_screen(self, winner, score):
-        """Display a dedicated winner screen"""
-        while True:
-            self.screen.fill((50, 50, 50))  # Dark background
-            
-            # Winner text
-            title_font = pygame.font.Font(None, 72)
-            title_text = title_font.render("Game Over!", True, (255, 255, 255))
-            title_rect = title_text.get_rect(center=(self.screen_width // 2, 200))
-            self.screen.blit(title_text, title_rect)
-
-            # Winner details
-            winner_font = pygame.font.Font(None, 48)
-            winner_text = winner_font.render(f"{winner} wins with {score} seeds!", True, (255, 255, 255))
-            winner_rect = winner_text.get_rect(center=(self.screen_width // 2, 300))
-            self.screen.blit(winner_text, winner_rect)
-
-            # Instructions
+        elif event.key == pygame.K_HOME:  # Start of the game
+            self.current_index = 0
+            self.update_display()
+        elif event.key == pygame.K_END:  # Latest position
+            self.current_index = len(self.record) - 1
+            self.update_display()
+
+    def draw_winner_screen(self, winner, score, instructions=True):
+        self.screen.fill((50, 50, 50))  # Dark background
+        
+        # Winner text
+        title_font = pygame.font.Font(None, 72)
+        title_text = title_font.render("Game Over!", True, (255, 255, 255))
+        title_rect = title_text.get_rect(center=(self.screen_width // 2, 200))
+        self.screen.blit(title_text, title_rect)
+
+        # Winner details
+        winner_font = pygame.font.Font(None, 48)
+        winner_text = winner_font.render(f"{winner} wins with {score} seeds!", True, (255, 255, 255))
+        winner_rect = winner_text.get_rect(center=(self.screen_width // 2, 300))
+        self.screen.blit(winner_text, winner_rect)
+
+        if instructions:
             instruction_font = pygame.font.Font(None, 32)
             instruction_text = instruction_font.render("Press SPACE to view final board or ESC to quit", True, (200, 200, 200))
             instruction_rect = instruction_text.get_rect(center=(self.screen_width // 2, 500))
             self.screen.blit(instruction_text, instruction_rect)
 
+    def display_winner_screen(self, winner, score):
+        """Display a dedicated winner screen"""
+        clock = pygame.time.Clock()
+        while True:
+            self.draw_winner_screen(winner, score)
             pygame.display.flip()
+            clock.tick(self.fps)
 
             # Event handling
             for event in pygame.event.get():
@@ -206,11 +249,11 @@ class MancalaGUI:
                         return  # Return to show final board
 
     def main_loop(self):
-        # Initialize game state history
-        self.history.append(self.game.game_ai1.state.board.copy())
-        self.current_index = 0
         self.update_display()
+        self.save_frame()
         ai_turn = 1
+        clock = pygame.time.Clock()
+        next_turn_at = time.time() + self.first_move_delay  # Pauses between moves, for visibility
 
         winner_announced = False
 
@@ -224,13 +267,20 @@ class MancalaGUI:
                     else:
                         self.handle_navigation(event)
 
-            if not winner_announced and not self.game.game_ai1.gameOver():
-                if ai_turn == 1:
-                    self.ai_turn(self.game.ai1_turn, "AI 1")
-                    ai_turn = -1
+            if self.searcher.busy:
+                # The board belongs to the search until it reports back
+                result = self.searcher.poll()
+                if result is None:
+                    self.show_progress(ai_turn)
                 else:
-                    self.ai_turn(self.game.ai2_turn, "AI 2")
-                    ai_turn = 1
+                    self.finish_ai_turn(ai_turn, result)
+                    # An AI whose last seed lands in its own store moves again
+                    if not result.extra_turn:
+                        ai_turn = -ai_turn
+                    next_turn_at = time.time() + self.move_delay
+            elif not winner_announced and not self.game.game_ai1.gameOver():
+                if time.time() >= next_turn_at:
+                    self.start_ai_turn(ai_turn)
             elif not winner_announced:
                 # Game is over, determine winner
                 winner, score = self.game.game_ai1.findWinner()
@@ -240,9 +290,96 @@ class MancalaGUI:
                 
                 winner_announced = True
 
+            clock.tick(self.fps)
+
+        self.searcher.cancel()
+        self.record.close()
+        self.game.close()
+        pygame.quit()
+        sys.exit()
+
+    def replay_loop(self, record):
+        """Shows a saved game instead of playing one
+
+        LEFT/RIGHT step through the moves, HOME/END jump to the start or end.
+        """
+        self.record.close()
+        self.record = record
+        self.current_index = 0
+        self.update_display()
+        clock = pygame.time.Clock()
+
+        while self.running:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.running = False
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        self.running = False
+                    else:
+                        self.handle_navigation(event)
+            clock.tick(self.fps)
+
+        self.game.close()
         pygame.quit()
         sys.exit()
 
+    def run_headless(self):
+        """Plays the game straight through without a window or event loop
+
+        Searches run on this thread, one after another. With frames_dir set,
+        the board after every move and the final result are saved as PNGs.
+        Returns (winner, score).
+        """
+        self.update_display()
+        self.save_frame()
+
+        ai_turn = 1
+        while not self.game.game_ai1.gameOver():
+            game, ai_type, depth, _ = self.ai_player(ai_turn)
+            result = self.game.search(game, ai_type, depth)
+            self.finish_ai_turn(ai_turn, result)
+            if not result.extra_turn:
+                ai_turn = -ai_turn
+
+        winner, score = self.game.game_ai1.findWinner()
+        if self.frames_dir:
+            self.draw_winner_screen(winner, score, instructions=False)
+            self.save_frame()
+        self.record.close()
+        self.game.close()
+        pygame.quit()
+        return winner, score
+
 if __name__ == "__main__":
-    gui = MancalaGUI()
-    gui.main_loop()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Mancala AI vs AI")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processes for root-parallel search (default: 1, serial)")
+    parser.add_argument("--endgame-db", default=None,
+                        help="endgame database written by endgame_db.py")
+    parser.add_argument("--opening-book", default=None,
+                        help="opening book written by opening_book.py")
+    parser.add_argument("--fps", type=int, default=30,
+                        help="frame rate cap of the window (default: 30)")
+    parser.add_argument("--turbo", action="store_true",
+                        help="no pauses between moves")
+    parser.add_argument("--headless", action="store_true",
+                        help="no window: play the game out as fast as the search allows")
+    parser.add_argument("--frames", default=None, metavar="DIR",
+                        help="save the board after every move as DIR/frame_NNNN.png")
+    parser.add_argument("--record", default=None, metavar="PATH",
+                        help="write the game to PATH as it is played (.jsonl: JSON lines, else binary)")
+    parser.add_argument("--replay", default=None, metavar="PATH",
+                        help="step through a game saved with --record instead of playing one")
+    args = parser.parse_args()
+
+    gui = MancalaGUI(workers=args.workers, endgame_db=args.endgame_db, opening_book=args.opening_book,
+                     fps=args.fps, turbo=args.turbo, headless=args.headless, frames_dir=args.frames,
+                     record_path=args.record)
+    if args.replay:
+        gui.replay_loop(GameRecord.load(args.replay))
+    elif args.headless:
+        winner, score = gui.run_headless()
+        print(f"{winner} wins with {score} seeds!")
+    else:
+        gui.main_loop()
\ No newline at end of file
@@ -0,0 +1,178 @@
+import argparse
+import time
+
+import _engine_path  # noqa: F401
+from mancala_engine import MancalaBoard, PLAYER1_PITS, PLAYER2_PITS, SLOT_KEYS
+
+SIDE_PITS = (None, PLAYER1_PITS, PLAYER2_PITS)
+
+# Leaf counts from the start position (side 1 to move), from ReferenceBoard
+START_COUNTS = {
+    1: 6,
+    2: 35,
+    3: 185,
+    4: 942,
+    5: 4_690,
+    6: 23_233,
+    7: 114_430,
+    8: 563_055,
+    9: 2_763_490,
+    10: 13_519_607,
+}
+
+
+class ReferenceBoard:
+    """The original dict-based board, kept as the rules reference for perft
+
+    Deliberately plain: a dict per position, copied for every move.
+    doMove returns True when the last seed lands in the mover's own store.
+    """
+
+    def __init__(self, board=None):
+        self.board = dict(board) if board is not None else {
+            'A': 4, 'B': 4, 'C': 4, 'D': 4, 'E': 4, 'F': 4,
+            'G': 4, 'H': 4, 'I': 4, 'J': 4, 'K': 4, 'L': 4,
+            1: 0, 2: 0
+        }
+        self.player1_pits = PLAYER1_PITS
+        self.player2_pits = PLAYER2_PITS
+        self.opposite_pits = {
+            'A': 'L', 'B': 'K', 'C': 'J', 'D': 'I', 'E': 'H', 'F': 'G',
+            'G': 'F', 'H': 'E', 'I': 'D', 'J': 'C', 'K': 'B', 'L': 'A'
+        }
+        self.next_pit = {
+            'A': 'B', 'B': 'C', 'C': 'D', 'D': 'E', 'E': 'F', 'F': 1,
+            1: 'G', 'G': 'H', 'H': 'I', 'I': 'J', 'J': 'K', 'K': 'L',
+            'L': 2, 2: 'A'
+        }
+
+    def possibleMoves(self, player_pits):
+        return [pit for pit in player_pits if self.board[pit] > 0]
+
+    def doMove(self, player_pits, pit):
+        seeds = self.board[pit]
+        self.board[pit] = 0
+        store = 1 if player_pits == self.player1_pits else 2
+
+        # Distribute seeds counterclockwise, skipping the opponent's store
+        current_pit = pit
+        while seeds > 0:
+            current_pit = self.next_pit[current_pit]
+            if isinstance(current_pit, int) and current_pit != store:
+                continue
+            self.board[current_pit] += 1
+            seeds -= 1
+
+        # Capture: last seed in an empty pit of the mover's, opposite pit not empty
+        if current_pit in player_pits and self.board[current_pit] == 1:
+            opposite_pit = self.opposite_pits[current_pit]
+            if self.board[opposite_pit] > 0:
+                self.board[store] += self.board[current_pit] + self.board[opposite_pit]
+                self.board[current_pit] = 0
+                self.board[opposite_pit] = 0
+
+        return current_pit == store
+
+    def copy(self):
+        return ReferenceBoard(self.board)
+
+
+def _finished(board):
+    # A side with empty pits ends the game
+    return not board.possibleMoves(PLAYER1_PITS) or not board.possibleMoves(PLAYER2_PITS)
+
+
+def perft(board, side, depth):
+    """Number of positions exactly `depth` plies after (board, side to move)
+
+    A ply is one move; after an extra turn the same side plays the next
+    ply. Lines that end the game early reach no leaf, so they count 0.
+    The board is played on in place and restored after each move.
+    """
+    if depth == 0:
+        return 1
+    if _finished(board):
+        return 0
+    before = board.snapshot()
+    total = 0
+    for pit in board.possibleMoves(SIDE_PITS[side]):
+        extra_turn = board.doMove(None, pit)
+        total += perft(board, side if extra_turn else 3 - side, depth - 1)
+        board.restore(before)
+    return total
+
+
+def reference_perft(board, side, depth):
+    # perft on ReferenceBoard, copying the board for every move
+    if depth == 0:
+        return 1
+    if _finished(board):
+        return 0
+    total = 0
+    for pit in board.possibleMoves(SIDE_PITS[side]):
+        child = board.copy()
+        extra_turn = child.doMove(SIDE_PITS[side], pit)
+        total += reference_perft(child, side if extra_turn else 3 - side, depth - 1)
+    return total
+
+
+def divide(board, side, depth, count=perft):
+    """Leaf counts per root move: {pit: perft of the position after that move}"""
+    counts = {}
+    for pit in board.possibleMoves(SIDE_PITS[side]):
+        child = board.copy()
+        extra_turn = child.doMove(SIDE_PITS[side], pit)
+        counts[pit] = count(child, side if extra_turn else 3 - side, depth - 1)
+    return counts
+
+
+def verify(board, side, depth):
+    """Root moves whose counts differ between MancalaBoard and ReferenceBoard, per depth"""
+    reference = ReferenceBoard(board.board.items())
+    mismatches = {}
+    for d in range(1, depth + 1):
+        ours = divide(board, side, d)
+        theirs = divide(reference, side, d, reference_perft)
+        if ours != theirs:
+            mismatches[d] = {pit: (ours.get(pit), theirs.get(pit))
+                             for pit in set(ours) | set(theirs) if ours.get(pit) != theirs.get(pit)}
+    return mismatches
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Count Mancala move-generation leaves (perft)")
+    parser.add_argument("--depth", type=int, default=8)
+    parser.add_argument("--slots", default=None,
+                        help="14 comma-separated counts in sowing order (A-F, store 1, G-L, store 2); "
+                             "default: the start position")
+    parser.add_argument("--side", type=int, default=1, choices=[1, 2], help="side to move (1 plays A-F)")
+    parser.add_argument("--divide", action="store_true", help="break the count down per root move")
+    parser.add_argument("--verify", action="store_true",
+                        help="check every depth up to --depth against the dict-based reference board")
+    args = parser.parse_args()
+
+    board = MancalaBoard()
+    if args.slots:
+        board.board = dict(zip(SLOT_KEYS, (int(count) for count in args.slots.split(','))))
+
+    counts = {}
+    for depth in range(1, args.depth + 1):
+        start = time.perf_counter()
+        leaves = counts[depth] = perft(board, args.side, depth)
+        elapsed = time.perf_counter() - start
+        rate = leaves / elapsed if elapsed > 0 else 0.0
+        print(f"depth {depth:2}  {leaves:14,} leaves  {elapsed:8.3f} s  {rate:12,.0f} leaves/s")
+    if args.divide:
+        for pit, leaves in divide(board, args.side, args.depth).items():
+            print(f"  {pit}: {leaves:,}")
+    if not args.slots and args.side == 1 and args.depth in START_COUNTS:
+        expected = START_COUNTS[args.depth]
+        print(f"start position: {'ok' if counts[args.depth] == expected else 'MISMATCH'} "
+              f"(expected {expected:,})")
+    if args.verify:
+        mismatches = verify(board, args.side, args.depth)
+        if mismatches:
+            for depth, pits in mismatches.items():
+                print(f"depth {depth} differs: {pits}")
+            raise SystemExit(1)
+        print(f"matches the reference board at every depth up to {args.depth}")
@@ -0,0 +1,137 @@
+import json
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import _engine_path  # noqa: F401
+from mancala_engine import MancalaBoard, Play, SLOT_KEYS
+
+
+def parse_engine(spec):
+    """Engine from a spec like 'ai2', 'ai1:depth=6' or 'ai2:time=0.05'
+
+    The heuristic comes first ('ai1' or 'ai2'). A depth gives a fixed-depth
+    search; otherwise the engine deepens until its time budget (seconds) runs out.
+    """
+    heuristic, *options = spec.split(':')
+    if heuristic not in ('ai1', 'ai2'):
+        raise ValueError(f"unknown heuristic {heuristic!r} in engine spec {spec!r}")
+    engine = {'name': spec, 'heuristic': heuristic, 'depth': None, 'time': 0.2}
+    for option in options:
+        name, _, value = option.partition('=')
+        if name == 'depth':
+            engine['depth'] = int(value)
+        elif name == 'time':
+            engine['time'] = float(value)
+        else:
+            raise ValueError(f"unknown option {name!r} in engine spec {spec!r}")
+    return engine
+
+
+def random_opening(plies, rng):
+    # Slots played by random legal moves from the start position (side 1 moves first)
+    board = MancalaBoard()
+    side = 1
+    opening = []
+    for _ in range(plies):
+        moves = board.legal_slots(side)
+        if not moves or not board.legal_slots(3 - side):
+            break
+        slot = rng.choice(moves)
+        opening.append(slot)
+        if not board.sow(slot):
+            side = 3 - side
+    return opening
+
+
+def play_game(index, engine_a, engine_b, a_side, opening, endgame_db=None, opening_book=None):
+    """Play one silent game; returns a result dict from engine A's point of view"""
+    engines = {a_side: engine_a, 3 - a_side: engine_b}
+    # One Play per engine, so tables, move ordering and node counts aren't shared
+    plays = {side: Play(time_budget=engine['time'], endgame_db=endgame_db, opening_book=opening_book)
+             for side, engine in engines.items()}
+    games = {1: plays[1].game_ai1, 2: plays[2].game_ai2}
+    # ... playing on one board
+    games[2].state = plays[2].game_ai1.state = games[1].state
+    think = {1: 0.0, 2: 0.0}
+    moves = {1: 0, 2: 0}
+
+    side = 1
+    for slot in opening:
+        if not games[1].state.sow(slot):
+            side = 3 - side
+
+    plies = 0
+    while not games[1].gameOver():
+        engine = engines[side]
+        start = time.perf_counter()
+        _, pit = plays[side].best_move(games[side], engine['heuristic'], engine['depth'])
+        think[side] += time.perf_counter() - start
+        moves[side] += 1
+        plies += 1
+        if not games[side].state.doMove(None, pit):
+            side = 3 - side
+
+    board = games[1].state.board
+    score_a, score_b = board[a_side], board[3 - a_side]
+    return {
+        'game': index,
+        'engine_a': engine_a['name'],
+        'engine_b': engine_b['name'],
+        'a_side': a_side,
+        'opening': [SLOT_KEYS[slot] for slot in opening],
+        'score_a': score_a,
+        'score_b': score_b,
+        'margin': score_a - score_b,
+        'result': 'win' if score_a > score_b else 'loss' if score_a < score_b else 'draw',
+        'plies': plies,
+        'move_time_a': think[a_side] / moves[a_side] if moves[a_side] else 0.0,
+        'move_time_b': think[3 - a_side] / moves[3 - a_side] if moves[3 - a_side] else 0.0,
+    }
+
+
+def summarize(results):
+    # Totals from engine A's point of view
+    count = len(results)
+    summary = {
+        'games': count,
+        'wins': sum(r['result'] == 'win' for r in results),
+        'losses': sum(r['result'] == 'loss' for r in results),
+        'draws': sum(r['result'] == 'draw' for r in results),
+        'mean_margin': sum(r['margin'] for r in results) / count if count else 0.0,
+        'move_time_a': sum(r['move_time_a'] for r in results) / count if count else 0.0,
+        'move_time_b': sum(r['move_time_b'] for r in results) / count if count else 0.0,
+    }
+    return summary
+
+
+def run_tournament(engine_a, engine_b, games=100, workers=None, opening_plies=2,
+                   seed=0, out_path=None, endgame_db=None, opening_book=None):
+    """Play `games` games between two engines across a process pool
+
+    Each random opening is played twice with the engines swapping sides.
+    Per-game results are written to `out_path` (JSON lines) as they finish.
+    """
+    rng = random.Random(seed)
+    tasks = []
+    for index in range(games):
+        if index % 2 == 0:
+            opening = random_opening(opening_plies, rng)
+        tasks.append((index, engine_a, engine_b, 1 if index % 2 == 0 else 2, opening, endgame_db,
+                      opening_book))
+
+    results = []
+    out = open(out_path, 'w') if out_path else None
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(play_game, *task) for task in tasks]
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                if out:
+                    out.write(json.dumps(result) + '\n')
+                    out.flush()
+    finally:
+        if out:
+            out.close()
+    return summarize(results)
@@ -1,8 +1,14 @@
+import argparse
+import os
 import pygame
 import sys
 import copy
 import math
 import random
+
+# The engine package lives at the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from mancala_engine import MancalaBoard, Play, BackgroundSearch, Ponderer
 #this is the best version
 # Colors
 BACKGROUND_COLOR = (247, 236, 216)  # Warm beige
@@ -18,62 +24,10 @@ TEXT_COLOR = (0, 0, 0)
 HIGHLIGHT_COLOR = (255, 215, 0)  # Gold for highlighting
 BUTTON_COLOR = (160, 82, 45)  # Sienna
 BUTTON_HOVER_COLOR = (205, 133, 63)  # Lighter brown
-
-class MancalaBoard:
-    def __init__(self):
-        # Board initialization
-        self.board = {
-            'A': 4, 'B': 4, 'C': 4, 'D': 4, 'E': 4, 'F': 4,
-            'G': 4, 'H': 4, 'I': 4, 'J': 4, 'K': 4, 'L': 4,
-            1: 0, 2: 0
-        }
-        
-        self.player1_pits = ['A', 'B', 'C', 'D', 'E', 'F']
-        self.player2_pits = ['G', 'H', 'I', 'J', 'K', 'L']
-        
-        self.opposite_pits = {
-            'A': 'L', 'B': 'K', 'C': 'J', 'D': 'I', 'E': 'H', 'F': 'G',
-            'G': 'F', 'H': 'E', 'I': 'D', 'J': 'C', 'K': 'B', 'L': 'A'
-        }
-        
-        self.next_pit = {
-            'A': 'B', 'B': 'C', 'C': 'D', 'D': 'E', 'E': 'F', 'F': 1,
-            1: 'G', 'G': 'H', 'H': 'I', 'I': 'J', 'J': 'K', 'K': 'L', 
-            'L': 2, 2: 'A'
-        }
-
-    def possibleMoves(self, player_pits):
-        return [pit for pit in player_pits if self.board[pit] > 0]
-    
-    def doMove(self, player_pits, pit):
-        seeds = self.board[pit]
-        self.board[pit] = 0
-        
-        current_pit = pit
-        while seeds > 0: 
-            current_pit = self.next_pit[current_pit]
-            
-            # Skip opponent's store
-            if (isinstance(current_pit, int) and 
-                ((player_pits == self.player1_pits and current_pit == 2) or 
-                 (player_pits == self.player2_pits and current_pit == 1))):
-                continue
-            
-            # Drop a seed
-            self.board[current_pit] += 1
-            seeds -= 1
-        
-        # Capturing seeds logic
-        if str(current_pit) in player_pits and self.board[current_pit] == 1:
-            opposite_pit = self.opposite_pits[current_pit]
-            if self.board[opposite_pit] > 0:
-                store = 1 if player_pits == self.player1_pits else 2
-                self.board[store] += self.board[current_pit] + self.board[opposite_pit]
-                self.board[current_pit] = 0
-                self.board[opposite_pit] = 0
+TEXT_CACHE_SIZE = 256  # Rendered strings kept; the oldest is dropped beyond this
 
 class MancalaPygame:
-    def __init__(self):
+    def __init__(self, ponder=True, time_budget=1.0):
         pygame.init()
         
         # Screen setup
@@ -90,9 +44,25 @@ class MancalaPygame:
         self.board = MancalaBoard()
         self.current_player = None
         self.game_over = False
+
+        # Engine for the computer (pits G-L), thinking up to time_budget seconds a move.
+        # Its board is separate from self.board and only touched by the search thread
+        self.time_budget = time_budget
+        self.engine = Play(ai1_side='A', ai2_side='G', time_budget=time_budget)
+        self.computer = self.engine.game_ai2
+        self.searcher = BackgroundSearch(self.engine)
+        # Pondering: search replies to the human's moves while the human thinks
+        self.ponder = ponder
+        self.ponderer = Ponderer(self.engine, self.computer, 'ai2')
         
         # Pit and seed rendering
         self.pit_positions = self.calculate_pit_positions()
+        self.static_layer = self.render_static_layer()
+        # What is on screen: pit -> (seed count, area drawn on), 'turn' -> (player, area)
+        self.drawn = {}
+        # Pre-rendered seeds per seed count, and rendered strings per (font, text, color)
+        self.seed_sprites = {}
+        self.text_cache = {}
         
     def draw_button(self, text, x, y, width, height, hover=False):
         """Draw a button with optional hover effect"""
@@ -101,7 +71,7 @@ class MancalaPygame:
         pygame.draw.rect(self.screen, button_color, button_rect, border_radius=10)
         
         # Render text
-        text_surface = self.text_font.render(text, True, TEXT_COLOR)
+        text_surface = self.render_text(self.text_font, text, TEXT_COLOR)
         text_rect = text_surface.get_rect(center=button_rect.center)
         self.screen.blit(text_surface, text_rect)
         
@@ -113,12 +83,12 @@ class MancalaPygame:
             self.screen.fill(BACKGROUND_COLOR)
             
             # Title
-            title = self.title_font.render('Mancala', True, TEXT_COLOR)
+            title = self.render_text(self.title_font, 'Mancala', TEXT_COLOR)
             title_rect = title.get_rect(center=(self.WIDTH//2, 100))
             self.screen.blit(title, title_rect)
             
             # Subtitle
-            subtitle = self.subtitle_font.render('Choose Who Starts', True, TEXT_COLOR)
+            subtitle = self.render_text(self.subtitle_font, 'Choose Who Starts', TEXT_COLOR)
             subtitle_rect = subtitle.get_rect(center=(self.WIDTH//2, 200))
             self.screen.blit(subtitle, subtitle_rect)
             
@@ -145,7 +115,7 @@ class MancalaPygame:
             )
             
             # Instruction text
-            instruction = self.text_font.render('Click to select who goes first', True, TEXT_COLOR)
+            instruction = self.render_text(self.text_font, 'Click to select who goes first', TEXT_COLOR)
             instruction_rect = instruction.get_rect(center=(self.WIDTH//2, 500))
             self.screen.blit(instruction, instruction_rect)
             
@@ -186,61 +156,90 @@ class MancalaPygame:
         
         return positions
     
-    def draw_elegant_seeds(self, x, y, width, height, seed_count):
+    def render_text(self, font, text, color):
+        """font.render(text, True, color), rendered once and reused"""
+        key = (font, text, color)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            if len(self.text_cache) >= TEXT_CACHE_SIZE:
+                del self.text_cache[next(iter(self.text_cache))]
+            surface = self.text_cache[key] = font.render(text, True, color)
+        return surface
+    
+    def seed_sprite(self, seed_count):
         """
         Render seeds in a more elegant and structured manner
+
+        The seeds are drawn once per count onto a transparent surface, so a
+        pit's seeds keep their jitter from frame to frame. Returns the
+        surface and the offset of its top-left corner from the pit centre.
         """
+        if seed_count in self.seed_sprites:
+            return self.seed_sprites[seed_count]
+
         seed_radius = 8  # Slightly smaller seeds
         max_seeds_per_row = 5  # Maximum seeds per row/grid
         
         # Seed positioning grid
         seed_spacing = seed_radius * 2.5
+        grid_width = min(seed_count, max_seeds_per_row) * seed_spacing
+        grid_height = (seed_count // max_seeds_per_row + 1) * seed_spacing
         
+        # Seed centres around the pit centre, with slight randomness
+        centres = []
         for i in range(seed_count):
-            # Calculate grid position
             row = i // max_seeds_per_row
             col = i % max_seeds_per_row
-            
-            # Center the seed grid within the pit
-            grid_width = min(seed_count, max_seeds_per_row) * seed_spacing
-            grid_height = (seed_count // max_seeds_per_row + 1) * seed_spacing
-            
-            start_x = x + width/2 - grid_width/2 + col * seed_spacing
-            start_y = y + height/2 - grid_height/2 + row * seed_spacing
-            
-            # Slight randomness in seed position
             jitter_x = random.uniform(-seed_radius/2, seed_radius/2)
             jitter_y = random.uniform(-seed_radius/2, seed_radius/2)
-            
+            centres.append((int(-grid_width/2 + col * seed_spacing + jitter_x),
+                            int(-grid_height/2 + row * seed_spacing + jitter_y)))
+        
+        left = min((cx for cx, _ in centres), default=0) - seed_radius
+        top = min((cy for _, cy in centres), default=0) - seed_radius
+        right = max((cx for cx, _ in centres), default=0) + seed_radius + 1
+        bottom = max((cy for _, cy in centres), default=0) + seed_radius + 1
+        sprite = pygame.Surface((right - left, bottom - top), pygame.SRCALPHA)
+        
+        for i, (cx, cy) in enumerate(centres):
             # Choose seed color with variation
             seed_color = SEED_COLORS[i % len(SEED_COLORS)]
             
             # Draw seed with subtle depth
-            pygame.draw.circle(self.screen, seed_color, 
-                               (int(start_x + jitter_x), int(start_y + jitter_y)), 
-                               seed_radius)
+            pygame.draw.circle(sprite, seed_color, (cx - left, cy - top), seed_radius)
             
             # Add subtle highlight for depth
             highlight_color = tuple(min(255, c + 30) for c in seed_color)
-            pygame.draw.circle(self.screen, highlight_color, 
-                               (int(start_x + jitter_x), int(start_y + jitter_y)), 
-                               seed_radius // 2)
+            pygame.draw.circle(sprite, highlight_color, (cx - left, cy - top), seed_radius // 2)
+        
+        self.seed_sprites[seed_count] = (sprite, (left, top))
+        return self.seed_sprites[seed_count]
     
-    def draw_board(self):
+    def draw_elegant_seeds(self, x, y, width, height, seed_count):
+        """Draws the seeds centred in a pit; returns the rectangle they cover"""
+        sprite, (left, top) = self.seed_sprite(seed_count)
+        if not seed_count:
+            return pygame.Rect(x + width // 2, y + height // 2, 0, 0)
+        return self.screen.blit(sprite, (x + width // 2 + left, y + height // 2 + top))
+    
+    def render_static_layer(self):
+        """Everything that never changes during a game: background, board, empty pits, title"""
+        layer = pygame.Surface((self.WIDTH, self.HEIGHT)).convert()
+
         # Background with subtle gradient
         for i in range(self.HEIGHT):
             r = int(247 * (1 - i/self.HEIGHT) + 220 * (i/self.HEIGHT))
             g = int(236 * (1 - i/self.HEIGHT) + 220 * (i/self.HEIGHT))
             b = int(216 * (1 - i/self.HEIGHT) + 200 * (i/self.HEIGHT))
-            pygame.draw.line(self.screen, (r, g, b), (0, i), (self.WIDTH, i))
+            pygame.draw.line(layer, (r, g, b), (0, i), (self.WIDTH, i))
         
         # Game board with subtle shadow
         board_rect = pygame.Rect(300, 50, 600, 600)
         board_shadow = board_rect.inflate(10, 10)
-        pygame.draw.rect(self.screen, (100, 100, 100, 50), board_shadow, border_radius=40)
-        pygame.draw.rect(self.screen, BOARD_COLOR, board_rect, border_radius=30)
+        pygame.draw.rect(layer, (100, 100, 100, 50), board_shadow, border_radius=40)
+        pygame.draw.rect(layer, BOARD_COLOR, board_rect, border_radius=30)
         
-        # Draw pits and stores
+        # Empty pits and stores
         for pit, (x, y, width, height) in self.pit_positions.items():
             color = PIT_COLOR
             
@@ -250,42 +249,90 @@ class MancalaPygame:
             
             # Draw pit shadow
             if isinstance(pit, int):
-                pygame.draw.rect(self.screen, shadow_color, 
+                pygame.draw.rect(layer, shadow_color, 
                                  (x + shadow_offset, y + shadow_offset, width, height), 
                                  border_radius=20)
-                pygame.draw.rect(self.screen, color, (x, y, width, height), border_radius=20)
+                pygame.draw.rect(layer, color, (x, y, width, height), border_radius=20)
             else:
-                pygame.draw.ellipse(self.screen, shadow_color, 
+                pygame.draw.ellipse(layer, shadow_color, 
                                     (x + shadow_offset, y + shadow_offset, width, height))
-                pygame.draw.ellipse(self.screen, color, (x, y, width, height))
-            
-            # Draw seeds in each pit
-            seed_count = self.board.board[pit]
-            self.draw_elegant_seeds(x, y, width, height, seed_count)
-            
-            # Seed count text with soft shadow
-            seed_text = self.text_font.render(str(seed_count), True, TEXT_COLOR)
-            shadow_text = self.text_font.render(str(seed_count), True, (200, 200, 200))
-            
-            text_rect = seed_text.get_rect(center=(x + width//2, y + height + 25))
-            shadow_rect = shadow_text.get_rect(center=(x + width//2 + 2, y + height + 27))
-            
-            self.screen.blit(shadow_text, shadow_rect)  # Shadow first
-            self.screen.blit(seed_text, text_rect)
+                pygame.draw.ellipse(layer, color, (x, y, width, height))
         
         # Refined title with shadow
         title = self.title_font.render('Mancala', True, TEXT_COLOR)
         shadow_title = self.title_font.render('Mancala', True, (200, 200, 200))
         
-        self.screen.blit(shadow_title, (self.WIDTH//2 - title.get_width()//2 + 2, 12))
-        self.screen.blit(title, (self.WIDTH//2 - title.get_width()//2, 10))
+        layer.blit(shadow_title, (self.WIDTH//2 - title.get_width()//2 + 2, 12))
+        layer.blit(title, (self.WIDTH//2 - title.get_width()//2, 10))
+        return layer
+    
+    def draw_pit(self, pit, seed_count):
+        """Draws a pit's seeds and count over the static layer; returns the area drawn on"""
+        x, y, width, height = self.pit_positions[pit]
+        area = self.draw_elegant_seeds(x, y, width, height, seed_count)
+        
+        # Seed count text with soft shadow
+        seed_text = self.render_text(self.text_font, str(seed_count), TEXT_COLOR)
+        shadow_text = self.render_text(self.text_font, str(seed_count), (200, 200, 200))
         
-        # Player indicators with improved styling
+        text_rect = seed_text.get_rect(center=(x + width//2, y + height + 25))
+        shadow_rect = shadow_text.get_rect(center=(x + width//2 + 2, y + height + 27))
+        
+        self.screen.blit(shadow_text, shadow_rect)  # Shadow first
+        self.screen.blit(seed_text, text_rect)
+        return area.union(text_rect).union(shadow_rect)
+    
+    def draw_item(self, key, value):
+        # A pit (value: its seed count) or the turn line (value: the player to move)
+        if key == 'turn':
+            return self.draw_turn()
+        return self.draw_pit(key, value)
+    
+    def draw_turn(self):
+        """Draws whose turn it is; returns the area drawn on"""
         player_text = 'Your Turn' if self.current_player == -1 else 'Computer Turn'
         player_color = (50, 150, 50) if self.current_player == -1 else (200, 50, 50)
-        player_render = self.subtitle_font.render(player_text, True, player_color)
+        player_render = self.render_text(self.subtitle_font, player_text, player_color)
         
-        self.screen.blit(player_render, (self.WIDTH//2 - player_render.get_width()//2, self.HEIGHT - 50))
+        return self.screen.blit(player_render, (self.WIDTH//2 - player_render.get_width()//2, self.HEIGHT - 50))
+    
+    def draw_board(self):
+        """Brings the screen up to date; returns the rectangles that changed
+
+        The static layer is blitted whole only for the first frame (or after
+        the window was exposed). After that only pits whose seed count
+        changed, and the turn line when the turn passes, are restored from
+        the static layer and redrawn, together with anything they overlap.
+        """
+        shown = dict(self.board.board)
+        shown['turn'] = self.current_player
+        if not self.drawn:
+            self.screen.blit(self.static_layer, (0, 0))
+            for key in shown:
+                self.drawn[key] = (shown[key], self.draw_item(key, shown[key]))
+            return [self.screen.get_rect()]
+
+        redraw = [key for key in shown if shown[key] != self.drawn[key][0]]
+        if not redraw:
+            return []
+        # Restoring an area wipes whatever else was drawn there, so that goes too
+        for key in redraw:
+            for other, (_, area) in self.drawn.items():
+                if other not in redraw and area.colliderect(self.drawn[key][1]):
+                    redraw.append(other)
+
+        dirty = []
+        for key in redraw:
+            old_area = self.drawn[key][1]
+            self.screen.blit(self.static_layer, old_area, old_area)
+            dirty.append(old_area)
+        # Same drawing order as a full redraw
+        for key in shown:
+            if key in redraw:
+                new_area = self.draw_item(key, shown[key])
+                self.drawn[key] = (shown[key], new_area)
+                dirty.append(new_area)
+        return dirty
     
     def handle_click(self, mouse_pos):
         for pit, (x, y, width, height) in self.pit_positions.items():
@@ -297,23 +344,27 @@ class MancalaPygame:
             if pit_rect.collidepoint(mouse_pos):
                 # Check if it's a valid move for the human player
                 if pit in self.board.possibleMoves(self.board.player1_pits):
-                    self.board.doMove(self.board.player1_pits, pit)
-                    self.current_player *= -1
+                    # The engine is needed for the reply now
+                    self.ponderer.cancel()
+                    # Last seed in your store: you play again
+                    if not self.board.doMove(self.board.player1_pits, pit):
+                        self.current_player *= -1
                 break
     
     def computer_turn(self):
-        """Computer's turn using simple strategy"""
-        # Get possible moves for computer (player 2 pits)
-        possible_moves = self.board.possibleMoves(self.board.player2_pits)
-        
-        if possible_moves:
-            # Randomly choose a pit with seeds
-            chosen_pit = random.choice(possible_moves)
-            
-            # Make the move
-            self.board.doMove(self.board.player2_pits, chosen_pit)
-            
-            # Switch player
+        """Computer's turn: the pondered reply if there is one, else a background search"""
+        if not self.searcher.busy:
+            result = self.ponderer.reply(self.board)
+            if result is None:
+                self.computer.state.load(self.board.pack(2))
+                self.searcher.start(self.computer, 'ai2')
+                return
+        else:
+            result = self.searcher.poll()
+            if result is None:
+                return  # Still thinking
+
+        if not self.board.doMove(self.board.player2_pits, result.move):
             self.current_player *= -1
     
     def check_game_over(self):
@@ -343,17 +394,29 @@ class MancalaPygame:
                 if event.type == pygame.QUIT:
                     return
                 
+                if event.type == pygame.VIDEOEXPOSE:
+                    self.drawn = {}  # Window contents lost: redraw everything
+                
                 if event.type == pygame.MOUSEBUTTONDOWN and self.current_player == -1:
                     self.handle_click(event.pos)
             
-            if self.current_player == 1:
-                self.computer_turn()
-            
             self.check_game_over()
             
-            self.draw_board()
-            pygame.display.flip()
+            if self.game_over:
+                pass
+            elif self.current_player == 1:
+                self.computer_turn()
+            elif self.ponder and self.ponderer.position != self.board.pack(1):
+                self.ponderer.start(self.board)
+            
+            # Only what changed is redrawn and sent to the display
+            dirty = self.draw_board()
+            if dirty:
+                pygame.display.update(dirty)
             clock.tick(30)
+
+        self.ponderer.cancel()
+        self.searcher.cancel()
         
         # Game over screen
         self.screen.fill(BACKGROUND_COLOR)
@@ -378,12 +441,19 @@ class MancalaPygame:
                     pygame.quit()
                     return
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_r:
-                    self.__init__()
+                    self.__init__(self.ponder, self.time_budget)
                     self.run()
                     waiting = False
 
 if __name__ == "__main__":
-    game = MancalaPygame()
+    parser = argparse.ArgumentParser(description="Mancala: you against the computer")
+    parser.add_argument("--no-ponder", action="store_true",
+                        help="don't search while it's your turn")
+    parser.add_argument("--time", type=float, default=1.0,
+                        help="seconds the computer may think per move (default: 1.0)")
+    args = parser.parse_args()
+
+    game = MancalaPygame(ponder=not args.no_ponder, time_budget=args.time)
     game.run()
     pygame.quit()
     sys.exit()
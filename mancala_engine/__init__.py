@@ -0,0 +1,12 @@
+"""Mancala engine shared by the AI vs AI, human vs AI and console front ends
+
+The board and move generation, the game rules and the search live in
+mancala_game; the other modules add the search's optional parts (parallel
+root search, endgame database, opening book, statistics, background search)
+and game records for replays.
+"""
+from .mancala_game import (MancalaBoard, Game, Play, SearchResult, SearchTimeout, SearchCancelled,
+                           SLOT_KEYS, PIT_SLOTS, PLAYER1_PITS, PLAYER2_PITS,
+                           packed_to_bytes, packed_from_bytes)
+from .background_search import BackgroundSearch, Ponderer
+from .game_record import GameRecord
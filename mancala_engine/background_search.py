@@ -0,0 +1,142 @@
+import queue
+import threading
+
+from .mancala_game import MancalaBoard, SearchCancelled
+
+# Pondering passes: each pass searches every reply again with twice the time
+PONDER_PASSES = 3
+
+
+class BackgroundSearch:
+    """Runs Play.search on a worker thread so a pygame loop keeps pumping events
+
+    start() launches a search, poll() returns its SearchResult once it is
+    ready (None until then) and cancel() abandons it. `progress` holds
+    (depth, score, pit, nodes) of the last completed iteration. The board
+    belongs to the search while it runs: the caller should only draw from
+    its own copies and play the result after poll() hands it back.
+    """
+
+    def __init__(self, play):
+        self.play = play
+        self.results = queue.Queue()
+        self.thread = None
+        self.progress = None
+        play.progress = self._on_progress
+
+    @property
+    def busy(self):
+        return self.thread is not None
+
+    def _on_progress(self, depth, score, pit, nodes):
+        self.progress = (depth, score, pit, nodes)
+
+    def _run(self, game, ai_type, depth):
+        try:
+            result = self.play.search(game, ai_type, depth)
+        except SearchCancelled:
+            result = None
+        self.results.put(result)
+
+    def start(self, game, ai_type, depth=None):
+        if self.busy:
+            raise RuntimeError("a search is already running")
+        self.play.stop = False
+        self.progress = None
+        self.thread = threading.Thread(target=self._run, args=(game, ai_type, depth), daemon=True)
+        self.thread.start()
+
+    def poll(self):
+        """The finished search's SearchResult, or None while it is still running"""
+        if self.thread is None:
+            return None
+        try:
+            result = self.results.get_nowait()
+        except queue.Empty:
+            return None
+        self.thread.join()
+        self.thread = None
+        return result
+
+    def cancel(self):
+        # Stop the running search and wait until it has put the board back
+        if self.thread is None:
+            return
+        self.play.stop = True
+        self.thread.join()
+        self.thread = None
+        self.results = queue.Queue()
+        self.play.stop = False
+
+
+class Ponderer:
+    """Searches the computer's replies to the human's moves while the human thinks
+
+    start(board) takes the position with the human to move, plays each of
+    the human's moves (likeliest first, by the engine's move ordering) on a
+    private board and searches the computer's reply, with a longer budget on
+    each pass. reply(board) is the finished result for the position after
+    the human's move, if it was pondered; the transposition table keeps the
+    rest. Uses the same Play as BackgroundSearch, so never run both at once.
+    """
+
+    def __init__(self, play, game, ai_type):
+        self.play = play
+        self.game = game
+        self.ai_type = ai_type
+        self.thread = None
+        self.position = None
+        self.results = {}
+
+    @property
+    def busy(self):
+        return self.thread is not None
+
+    def _run(self, position):
+        play, game = self.play, self.game
+        computer = game.side(1)
+        board, human = MancalaBoard.unpack(position)
+        moves = board.legal_slots(human)
+        if play.ordering is not None:
+            moves = play.ordering.order(board, moves, 0)
+
+        # Only moves that hand the turn to the computer have a reply to ponder
+        replies = []
+        for slot in moves:
+            child = board.copy()
+            if child.sow(slot) or not child.legal_slots(1) or not child.legal_slots(2):
+                continue
+            replies.append(child.pack(computer))
+
+        time_budget = play.time_budget
+        try:
+            for _ in range(PONDER_PASSES):
+                for reply in replies:
+                    game.state.load(reply)
+                    self.results[reply] = play.search(game, self.ai_type)
+                play.time_budget *= 2
+        except SearchCancelled:
+            pass
+        finally:
+            play.time_budget = time_budget
+
+    def start(self, board):
+        # Ponder the position on `board` (the human to move)
+        self.cancel()
+        self.results = {}
+        self.position = board.pack(3 - self.game.side(1))
+        self.thread = threading.Thread(target=self._run, args=(self.position,), daemon=True)
+        self.thread.start()
+
+    def reply(self, board):
+        """Pondered SearchResult for the position on `board` (the computer to move), or None"""
+        return self.results.get(board.pack(self.game.side(1)))
+
+    def cancel(self):
+        # Stop pondering; results finished so far stay available to reply()
+        if self.thread is None:
+            return
+        self.play.stop = True
+        self.thread.join()
+        self.thread = None
+        self.play.stop = False
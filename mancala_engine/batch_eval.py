@@ -0,0 +1,59 @@
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for batched evaluation
+    np = None
+
+# evaluate_ai2 weights: store difference, mobility difference, pit-seed difference
+STORE_WEIGHT, MOBILITY_WEIGHT, SEEDS_WEIGHT = 1, 0.5, 0.3
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("batched evaluation needs numpy (pip install numpy)")
+
+
+def positions_array(positions):
+    """(N, 14) uint8 array from 14-byte slot snapshots (bytes/bytearray/MancalaBoard.seeds)"""
+    _require_numpy()
+    return np.frombuffer(b''.join(positions), dtype=np.uint8).reshape(-1, 14)
+
+
+def evaluate_ai1_batch(positions, perspective=1):
+    """Game.evaluate_ai1 for every row of an (N, 14) slot array"""
+    _require_numpy()
+    positions = np.asarray(positions, dtype=np.int16)
+    return perspective * (positions[:, 6] - positions[:, 13])
+
+
+def evaluate_ai2_batch(positions, perspective=1):
+    """Game.evaluate_ai2 for every row of an (N, 14) slot array
+
+    Rows use the board's slot layout (A-F, store 1, G-L, store 2). Scores are
+    from side 1's point of view, times `perspective` (-1 for side 2).
+    """
+    _require_numpy()
+    positions = np.asarray(positions, dtype=np.int16)
+    player1, player2 = positions[:, 0:6], positions[:, 7:13]
+    store_diff = positions[:, 6] - positions[:, 13]
+    moves_diff = np.count_nonzero(player1, axis=1) - np.count_nonzero(player2, axis=1)
+    distribution_bonus = player1.sum(axis=1) - player2.sum(axis=1)
+    return perspective * (STORE_WEIGHT * store_diff + MOBILITY_WEIGHT * moves_diff
+                          + SEEDS_WEIGHT * distribution_bonus)
+
+
+def score_positions(positions, ai_type='ai2', perspective=1, chunk_size=1 << 20):
+    """Score any number of positions with one of the heuristics, in chunks
+
+    `positions` is an (N, 14) array or an iterable of 14-byte snapshots; the
+    chunking keeps memory flat when scoring millions of positions.
+    """
+    _require_numpy()
+    evaluate = evaluate_ai1_batch if ai_type == 'ai1' else evaluate_ai2_batch
+    if not isinstance(positions, np.ndarray):
+        positions = positions_array(positions)
+    if len(positions) <= chunk_size:
+        return evaluate(positions, perspective)
+    return np.concatenate([
+        evaluate(positions[start:start + chunk_size], perspective)
+        for start in range(0, len(positions), chunk_size)
+    ])
@@ -0,0 +1,184 @@
+import argparse
+import mmap
+import os
+import struct
+import time
+from math import comb
+
+from .mancala_game import MancalaBoard, STORE1
+
+# File layout: header, then one signed byte per position (side 1 to move)
+MAGIC = b'MNCLEGDB'
+HEADER = struct.Struct('<8sII')  # magic, max seeds, position count
+UNKNOWN = -128
+
+
+def position_count(max_seeds):
+    # Positions of the 12 pits holding at most max_seeds seeds in total
+    return comb(max_seeds + 12, 12)
+
+
+def rank_tables(max_seeds):
+    """offsets[i][remaining][count] for the perfect index of a 12-pit position
+
+    Positions are ranked as compositions of max_seeds into 13 parts (the 12
+    pits plus the seeds not on the board), in lexicographic order.
+    """
+    offsets = []
+    for i in range(12):
+        parts_after = 12 - i
+        table = []
+        for remaining in range(max_seeds + 1):
+            row = [0]
+            for value in range(remaining):
+                row.append(row[-1] + comb(remaining - value + parts_after - 1, parts_after - 1))
+            table.append(row)
+        offsets.append(table)
+    return offsets
+
+
+def rank(pits, offsets, max_seeds):
+    # Index of a 12-pit position (mover's row first); total must be <= max_seeds
+    index = 0
+    remaining = max_seeds
+    for i, count in enumerate(pits):
+        index += offsets[i][remaining][count]
+        remaining -= count
+    return index
+
+
+def _potential(pits):
+    # Grows with every move that keeps all seeds in the pits, so it orders same-total positions
+    return sum(i % 6 * count for i, count in enumerate(pits))
+
+
+def _compositions(total, potential, pit=0):
+    # Seed counts for pits `pit`..11 holding `total` seeds with the given potential
+    weight = pit % 6
+    if pit == 11:
+        if weight * total == potential:
+            yield (total,)
+        return
+    # Potential the pits after this one can still make up, per seed
+    lowest = 0 if pit < 6 else weight + 1
+    for first in range(total + 1):
+        left = potential - weight * first
+        if left < 0:
+            break
+        rest = total - first
+        if lowest * rest <= left <= 5 * rest:
+            for counts in _compositions(rest, left, pit + 1):
+                yield (first,) + counts
+
+
+def positions_by_potential(total):
+    """Every 12-pit position holding `total` seeds, highest potential first
+
+    Generated one potential at a time, so a total's positions (13M of them
+    at 16 seeds) are never all in memory at once.
+    """
+    for potential in range(5 * total, -1, -1):
+        yield from _compositions(total, potential)
+
+
+def build(max_seeds, path, verbose=False):
+    """Solve every position with at most max_seeds seeds in the pits and write the file
+
+    Stored value: the best final seed margin the side to move can still force
+    from the seeds in the pits (stores excluded). Positions are solved from the
+    fewest seeds up; within one total, by decreasing potential, so every child
+    is already solved: a move either takes seeds out of the pits or shifts them
+    towards the mover's store. Side 2 to move is looked up as the mirrored
+    position, so one table covers both sides.
+    """
+    offsets = rank_tables(max_seeds)
+    values = bytearray(position_count(max_seeds))
+    known = bytearray(len(values))
+    board = MancalaBoard()
+    seeds = board.seeds
+    start = time.perf_counter()
+
+    def value_of(pits):
+        index = rank(pits, offsets, max_seeds)
+        assert known[index], pits
+        value = values[index]
+        return value - 256 if value > 127 else value
+
+    for total in range(max_seeds + 1):
+        solved = 0
+        for pits in positions_by_potential(total):
+            row1, row2 = sum(pits[:6]), sum(pits[6:])
+            if not row1 or not row2:
+                # Game over: each side keeps what is left on its own row
+                best = row1 - row2
+            else:
+                best = -128
+                for slot in range(6):
+                    if not pits[slot]:
+                        continue
+                    seeds[0:6] = bytes(pits[:6])
+                    seeds[7:13] = bytes(pits[6:])
+                    seeds[STORE1] = seeds[13] = 0
+                    extra_turn = board.sow(slot)
+                    gain = seeds[STORE1]
+                    own, other = tuple(seeds[0:6]), tuple(seeds[7:13])
+                    if not any(own) or not any(other):
+                        value = gain + sum(own) - sum(other)
+                    elif extra_turn:
+                        value = gain + value_of(own + other)
+                    else:
+                        value = gain - value_of(other + own)
+                    best = max(best, value)
+            index = rank(pits, offsets, max_seeds)
+            values[index] = best & 0xFF
+            known[index] = 1
+            solved += 1
+        if verbose:
+            print(f"{total:2d} seeds: {solved} positions ({time.perf_counter() - start:.1f}s)")
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, max_seeds, len(values)))
+        f.write(values)
+
+
+class EndgameDB:
+    """Read-only, memory-mapped endgame table written by build()"""
+
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.max_seeds, count = HEADER.unpack_from(self.data)
+        if magic != MAGIC or count != position_count(self.max_seeds):
+            raise ValueError(f"{path} is not an endgame database")
+        self.offsets = rank_tables(self.max_seeds)
+        self.hits = 0
+
+    def close(self):
+        self.data.close()
+        self.file.close()
+
+    def probe(self, seeds, side, in_pits=None):
+        """Exact margin still to come for the side to move, or None if not covered
+
+        `in_pits` is the number of seeds left in the pits, when the caller
+        already knows it (MancalaBoard.pit_seeds).
+        """
+        if in_pits is None:
+            in_pits = sum(seeds[0:6]) + sum(seeds[7:13])
+        if in_pits > self.max_seeds:
+            return None
+        own, other = (seeds[0:6], seeds[7:13]) if side == 1 else (seeds[7:13], seeds[0:6])
+        self.hits += 1
+        value = self.data[HEADER.size + rank(own + other, self.offsets, self.max_seeds)]
+        return value - 256 if value > 127 else value
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the Mancala endgame database")
+    parser.add_argument("--seeds", type=int, default=10, help="most seeds left in the pits (default: 10)")
+    parser.add_argument("--out", default=None, help="output file (default: endgame<seeds>.db)")
+    args = parser.parse_args()
+
+    out = args.out or f"endgame{args.seeds}.db"
+    build(args.seeds, out, verbose=True)
+    print(f"Wrote {position_count(args.seeds)} positions to {out} ({os.path.getsize(out)} bytes)")
@@ -0,0 +1,114 @@
+import json
+
+from .mancala_game import MancalaBoard, SLOT_KEYS, PIT_SLOTS, PACKED_BYTES, packed_to_bytes, packed_from_bytes
+
+# Binary layout: magic, the packed start position, then one byte per move (its slot)
+MAGIC = b'MNCLGAME'
+# Plies between kept positions; position(ply) replays fewer moves than this
+KEYFRAME_INTERVAL = 16
+
+
+class GameRecord:
+    """A game as its start position and the moves played, for replay and navigation
+
+    Positions are numbered by ply: 0 is the start, n the board after the
+    n-th move. Moves are kept as one slot byte each, plus the packed
+    position every `keyframe_interval` plies, so position(n) starts from
+    the nearest kept position instead of the beginning.
+
+    With `out_path` the record is streamed to disk as it grows: JSON lines
+    when the path ends in .jsonl (a header line with the start position,
+    then one line per move), else the binary layout above. load() reads
+    either back.
+    """
+
+    def __init__(self, start=None, out_path=None, keyframe_interval=KEYFRAME_INTERVAL):
+        if start is None:
+            start = MancalaBoard().pack(1)
+        self.start = start
+        self.keyframe_interval = keyframe_interval
+        self.moves = bytearray()
+        self.keyframes = [start]
+        # The latest position, moved on by append()
+        self.board, self.side = MancalaBoard.unpack(start)
+        self.out_path = out_path
+        self.out = None
+        if out_path:
+            self._write_header()
+
+    def __len__(self):
+        # Positions, the start included
+        return len(self.moves) + 1
+
+    def _jsonl(self):
+        return self.out_path.endswith('.jsonl')
+
+    def _write_header(self):
+        if self._jsonl():
+            self.out = open(self.out_path, 'w')
+            board, side = MancalaBoard.unpack(self.start)
+            self.out.write(json.dumps({'slots': list(board.seeds), 'side': side}) + '\n')
+        else:
+            self.out = open(self.out_path, 'wb')
+            self.out.write(MAGIC + packed_to_bytes(self.start))
+        self.out.flush()
+
+    def append(self, pit):
+        """Play `pit` (a letter) for the side to move; returns True on an extra turn"""
+        slot = PIT_SLOTS[pit]
+        if slot not in self.board.legal_slots(self.side):
+            raise ValueError(f"{pit} is not a legal move for side {self.side} at ply {len(self.moves)}")
+        extra_turn = self.board.sow(slot)
+        if not extra_turn:
+            self.side = 3 - self.side
+        self.moves.append(slot)
+        if len(self.moves) % self.keyframe_interval == 0:
+            self.keyframes.append(self.board.pack(self.side))
+
+        if self.out is not None:
+            if self._jsonl():
+                self.out.write(json.dumps({'ply': len(self.moves), 'move': pit}) + '\n')
+            else:
+                self.out.write(bytes((slot,)))
+            self.out.flush()
+        return extra_turn
+
+    def position(self, ply):
+        """(board, side to move) after `ply` moves, as a new MancalaBoard"""
+        if not 0 <= ply < len(self):
+            raise IndexError(f"ply {ply} outside 0..{len(self) - 1}")
+        keyframe = ply // self.keyframe_interval
+        board, side = MancalaBoard.unpack(self.keyframes[keyframe])
+        for slot in self.moves[keyframe * self.keyframe_interval:ply]:
+            if not board.sow(slot):
+                side = 3 - side
+        return board, side
+
+    def move(self, ply):
+        # The pit played to reach position `ply` (ply >= 1)
+        return SLOT_KEYS[self.moves[ply - 1]]
+
+    def close(self):
+        if self.out is not None:
+            self.out.close()
+            self.out = None
+
+    @classmethod
+    def load(cls, path, keyframe_interval=KEYFRAME_INTERVAL):
+        """Read a record written with out_path (either format)"""
+        with open(path, 'rb') as f:
+            data = f.read()
+        if data.startswith(MAGIC):
+            header = len(MAGIC) + PACKED_BYTES
+            record = cls(packed_from_bytes(data[len(MAGIC):header]), keyframe_interval=keyframe_interval)
+            moves = [SLOT_KEYS[slot] for slot in data[header:]]
+        else:
+            lines = data.decode().splitlines()
+            start = json.loads(lines[0])
+            board = MancalaBoard()
+            board.board = dict(zip(SLOT_KEYS, start['slots']))
+            record = cls(board.pack(start['side']), keyframe_interval=keyframe_interval)
+            moves = [json.loads(line)['move'] for line in lines[1:] if line.strip()]
+        for pit in moves:
+            record.append(pit)
+        return record
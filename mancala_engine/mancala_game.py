@@ -0,0 +1,871 @@
+import math
+import time
+
+from .move_ordering import MoveOrderer
+from .transposition import (ZOBRIST, ZOBRIST_STEP, EXACT, LOWER, UPPER,
+                           TranspositionTable, position_key, zobrist_hash)
+
+# Slot layout follows the sowing order: A-F, store 1, G-L, store 2.
+# These tables are shared by every board instead of being rebuilt per instance.
+SLOT_KEYS = ['A', 'B', 'C', 'D', 'E', 'F', 1, 'G', 'H', 'I', 'J', 'K', 'L', 2]
+PIT_SLOTS = {key: slot for slot, key in enumerate(SLOT_KEYS)}
+NUM_SLOTS = 14
+STORE1, STORE2 = 6, 13
+
+# Indexed by side (1 or 2); index 0 is unused
+STORE_SLOT = (None, STORE1, STORE2)
+SIDE_SLOTS = (None, tuple(range(0, 6)), tuple(range(7, 13)))
+
+# Side owning each slot and the slot facing each pit (stores face themselves)
+SLOT_SIDE = tuple(1 if slot <= STORE1 else 2 for slot in range(NUM_SLOTS))
+OPPOSITE_SLOT = tuple(12 - slot if slot not in (STORE1, STORE2) else slot
+                      for slot in range(NUM_SLOTS))
+
+# Letter-keyed tables kept for callers that still use the original API
+PLAYER1_PITS = ['A', 'B', 'C', 'D', 'E', 'F']
+PLAYER2_PITS = ['G', 'H', 'I', 'J', 'K', 'L']
+BOARD_KEYS = PLAYER1_PITS + PLAYER2_PITS + [1, 2]
+OPPOSITE_PITS = {pit: SLOT_KEYS[OPPOSITE_SLOT[PIT_SLOTS[pit]]]
+                 for pit in PLAYER1_PITS + PLAYER2_PITS}
+NEXT_PIT = {key: SLOT_KEYS[(slot + 1) % NUM_SLOTS] for slot, key in enumerate(SLOT_KEYS)}
+
+
+def _sowing_path(slot):
+    # The 13 slots a move from `slot` sows into, in order (opponent's store skipped)
+    skip = STORE2 if SLOT_SIDE[slot] == 1 else STORE1
+    path = []
+    current = slot
+    while len(path) < NUM_SLOTS - 1:
+        current = (current + 1) % NUM_SLOTS
+        if current != skip:
+            path.append(current)
+    return path
+
+
+# SOWING_PATH[slot][k] is the slot receiving the (k + 1)th seed of the move
+SOWING_PATH = [_sowing_path(slot) for slot in range(NUM_SLOTS)]
+
+
+def _pits_sown(slot, own):
+    # counts[k]: pits of the mover's (own) or the opponent's side among the first k slots sown
+    side = SLOT_SIDE[slot]
+    counts = [0]
+    for current in SOWING_PATH[slot]:
+        is_pit = current not in (STORE1, STORE2)
+        counts.append(counts[-1] + (is_pit and (SLOT_SIDE[current] == side) == own))
+    return counts
+
+
+# A full lap of 13 seeds puts one in each of the 12 pits and one in the mover's store
+OWN_PITS_SOWN = [_pits_sown(slot, True) for slot in range(NUM_SLOTS)]
+OPPONENT_PITS_SOWN = [_pits_sown(slot, False) for slot in range(NUM_SLOTS)]
+
+# Packed position: one int holding the 14 slot counts (a byte each, slot 0
+# lowest) with the side to move (0 or 1) in the byte above them
+PACKED_SIDE_SHIFT = 8 * NUM_SLOTS
+PACKED_SEEDS_MASK = (1 << PACKED_SIDE_SHIFT) - 1
+PACKED_BYTES = NUM_SLOTS + 1
+
+
+def packed_to_bytes(packed):
+    # Fixed-width record form of a packed position
+    return packed.to_bytes(PACKED_BYTES, 'little')
+
+
+def packed_from_bytes(data):
+    return int.from_bytes(data, 'little')
+
+
+class BoardView:
+    """Letter-keyed view over a board's slots, so `state.board['A']` keeps working"""
+    __slots__ = ('_owner',)
+
+    def __init__(self, owner):
+        self._owner = owner
+
+    def __getitem__(self, key):
+        return self._owner.seeds[PIT_SLOTS[key]]
+
+    def __setitem__(self, key, value):
+        self._owner.set_slot(PIT_SLOTS[key], value)
+
+    def __contains__(self, key):
+        return key in PIT_SLOTS
+
+    def __iter__(self):
+        return iter(BOARD_KEYS)
+
+    def __len__(self):
+        return NUM_SLOTS
+
+    def __eq__(self, other):
+        return dict(self.items()) == dict(other.items())
+
+    def get(self, key, default=None):
+        return self[key] if key in PIT_SLOTS else default
+
+    def keys(self):
+        return list(BOARD_KEYS)
+
+    def values(self):
+        return [self[key] for key in BOARD_KEYS]
+
+    def items(self):
+        return [(key, self[key]) for key in BOARD_KEYS]
+
+    def copy(self):
+        # Plain dict snapshot, same shape as the original board dict
+        return dict(self.items())
+
+    def __repr__(self):
+        return repr(self.copy())
+
+
+class MancalaBoard:
+    __slots__ = ('seeds', 'hash', 'pit_seeds', 'filled')
+
+    # Shared topology tables (class attributes, not per-instance copies)
+    player1_pits = PLAYER1_PITS
+    player2_pits = PLAYER2_PITS
+    opposite_pits = OPPOSITE_PITS
+    next_pit = NEXT_PIT
+
+    def __init__(self):
+        # 14 slots in sowing order: 4 seeds in each pit, empty stores
+        self.seeds = bytearray([4, 4, 4, 4, 4, 4, 0, 4, 4, 4, 4, 4, 4, 0])
+        # Zobrist hash of the slots, updated incrementally by every move
+        self.hash = zobrist_hash(self.seeds)
+        # Per side (index 1 and 2): seeds in its pits and how many pits are not empty.
+        # Kept up to date by every move so evaluation and the end test are O(1)
+        self.pit_seeds = [0, 24, 24]
+        self.filled = [0, 6, 6]
+
+    @property
+    def board(self):
+        return BoardView(self)
+
+    @board.setter
+    def board(self, values):
+        # Accept a letter-keyed dict (e.g. a saved history entry)
+        for key, count in values.items():
+            self.set_slot(PIT_SLOTS[key], count)
+
+    def set_slot(self, slot, count):
+        # Single-slot write that keeps the hash and the per-side totals in sync
+        old = self.seeds[slot]
+        self.hash ^= ZOBRIST[slot][old] ^ ZOBRIST[slot][count]
+        self.seeds[slot] = count
+        if slot != STORE1 and slot != STORE2:
+            side = SLOT_SIDE[slot]
+            self.pit_seeds[side] += count - old
+            self.filled[side] += (count > 0) - (old > 0)
+
+    def recount(self):
+        # Per-side totals from scratch, after the slots were overwritten wholesale
+        seeds = self.seeds
+        self.pit_seeds = [0, sum(seeds[0:6]), sum(seeds[7:13])]
+        self.filled = [0, 6 - seeds[0:6].count(0), 6 - seeds[7:13].count(0)]
+
+    def snapshot(self):
+        """Everything a move can change, for restore()"""
+        return bytes(self.seeds), self.hash, self.pit_seeds[:], self.filled[:]
+
+    def restore(self, snapshot):
+        seeds, self.hash, pit_seeds, filled = snapshot
+        self.seeds[:] = seeds
+        self.pit_seeds = pit_seeds[:]
+        self.filled = filled[:]
+
+    def possibleMoves(self, player_pits):
+        # Return pits with seeds for the given player
+        seeds = self.seeds
+        return [pit for pit in player_pits if seeds[PIT_SLOTS[pit]] > 0]
+
+    def legal_slots(self, side):
+        # Slot indices with seeds for side 1 (A-F) or side 2 (G-L)
+        seeds = self.seeds
+        return [slot for slot in SIDE_SLOTS[side] if seeds[slot]]
+
+    def doMove(self, player_pits, pit):
+        # The moving side is implied by the pit; player_pits is kept for API compatibility
+        return self.sow(PIT_SLOTS[pit])
+
+    def sow(self, slot):
+        """Play the pit at `slot` in place and return True if it earns an extra turn"""
+        seeds = self.seeds
+        side = SLOT_SIDE[slot]
+        store = STORE_SLOT[side]
+        skip = STORE2 if side == 1 else STORE1
+
+        # Collect seeds from the chosen pit & empty the pit
+        count = seeds[slot]
+        seeds[slot] = 0
+        h = self.hash ^ ZOBRIST[slot][count] ^ ZOBRIST[slot][0]
+
+        # Per-side pit totals: whole laps plus the part of the path the rest reaches
+        pit_seeds, filled = self.pit_seeds, self.filled
+        other = 3 - side
+        laps, rest = divmod(count, 13)
+        pit_seeds[side] += 6 * laps + OWN_PITS_SOWN[slot][rest] - count
+        pit_seeds[other] += 6 * laps + OPPONENT_PITS_SOWN[slot][rest]
+        filled[side] -= 1
+
+        # Distribute seeds counterclockwise, skipping the opponent's store
+        current = slot
+        while count:
+            current = current + 1 if current < STORE2 else 0
+            if current == skip:
+                continue
+            before = seeds[current]
+            if not before and current != store:
+                filled[SLOT_SIDE[current]] += 1
+            h ^= ZOBRIST_STEP[current][before]
+            seeds[current] = before + 1
+            count -= 1
+
+        # Capture when the last seed lands in an empty pit on the mover's side
+        if current != store and SLOT_SIDE[current] == side and seeds[current] == 1:
+            opposite = OPPOSITE_SLOT[current]
+            captured = seeds[opposite]
+            if captured:
+                before = seeds[store]
+                seeds[store] = before + 1 + captured
+                seeds[current] = 0
+                seeds[opposite] = 0
+                pit_seeds[side] -= 1
+                pit_seeds[other] -= captured
+                filled[side] -= 1
+                filled[other] -= 1
+                h ^= (ZOBRIST[store][before] ^ ZOBRIST[store][before + 1 + captured]
+                      ^ ZOBRIST[current][1] ^ ZOBRIST[current][0]
+                      ^ ZOBRIST[opposite][captured] ^ ZOBRIST[opposite][0])
+
+        self.hash = h
+
+        # Extra turn when the last seed lands in the mover's own store
+        return current == store
+
+    def landing_slot(self, slot):
+        # Slot where the last seed from `slot` lands, without playing the move
+        count = self.seeds[slot]
+        return SOWING_PATH[slot][(count - 1) % 13] if count else slot
+
+    def is_extra_turn(self, slot):
+        return self.seeds[slot] and self.landing_slot(slot) == STORE_SLOT[SLOT_SIDE[slot]]
+
+    def captured_seeds(self, slot):
+        """Seeds the move from `slot` would capture from the opposite pit (0 if none)"""
+        seeds = self.seeds
+        count = seeds[slot]
+        if not count:
+            return 0
+        path = SOWING_PATH[slot]
+        laps, rest = divmod(count, 13)
+        last = path[rest - 1] if rest else slot
+        if SLOT_SIDE[last] != SLOT_SIDE[slot] or last == STORE_SLOT[SLOT_SIDE[slot]]:
+            return 0
+
+        # Seeds in the landing pit once sowing ends: must be just the last one
+        landed = (0 if last == slot else seeds[last]) + laps + (1 if rest else 0)
+        if landed != 1:
+            return 0
+        opposite = OPPOSITE_SLOT[last]
+        return seeds[opposite] + laps + (1 if opposite in path[:rest] else 0)
+
+    def copy(self):
+        """Create a copy of the board state without re-running __init__"""
+        new_board = MancalaBoard.__new__(MancalaBoard)
+        new_board.seeds = bytearray(self.seeds)
+        new_board.hash = self.hash
+        new_board.pit_seeds = self.pit_seeds[:]
+        new_board.filled = self.filled[:]
+        return new_board
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    def pack(self, side=1):
+        """The slots and the side to move as one int (a dict key, record or message)"""
+        return int.from_bytes(self.seeds, 'little') | (side - 1) << PACKED_SIDE_SHIFT
+
+    def load(self, packed):
+        """Set the slots from a packed position; returns its side to move"""
+        self.seeds[:] = (packed & PACKED_SEEDS_MASK).to_bytes(NUM_SLOTS, 'little')
+        self.hash = zobrist_hash(self.seeds)
+        self.recount()
+        return (packed >> PACKED_SIDE_SHIFT) + 1
+
+    @classmethod
+    def unpack(cls, packed):
+        """(board, side to move) from a packed position"""
+        board = cls.__new__(cls)
+        board.seeds = bytearray(NUM_SLOTS)
+        side = board.load(packed)
+        return board, side
+
+class Game:
+    def __init__(self, human_side='G', computer_side='A'):
+        self.state = MancalaBoard()
+        self.playerSide = {
+            1: computer_side,   
+            -1: human_side      
+        }
+        # Evaluations are scored from the computer's side of the board
+        self.perspective = 1 if computer_side in PLAYER1_PITS else -1
+    
+    def is_terminal(self):
+        # Game over when either player has no seeds in their pits; changes nothing
+        filled = self.state.filled
+        return not filled[1] or not filled[2]
+
+    def final_margin(self):
+        # Side 1's store minus side 2's once the game is over and the pits are swept
+        state = self.state
+        seeds, pit_seeds = state.seeds, state.pit_seeds
+        return seeds[STORE1] + pit_seeds[1] - seeds[STORE2] - pit_seeds[2]
+
+    def final_score(self):
+        """Exact result of a finished game from the computer's side (both heuristics agree)"""
+        return self.perspective * self.final_margin()
+
+    def finalize(self):
+        # End of game: each side's remaining seeds go to its own store
+        state = self.state
+        seeds = state.seeds
+        for side, store in ((1, STORE1), (2, STORE2)):
+            for slot in SIDE_SLOTS[side]:
+                if seeds[slot]:
+                    state.set_slot(store, seeds[store] + seeds[slot])
+                    state.set_slot(slot, 0)
+
+    def gameOver(self):
+        # Check if the game is over and, if so, collect the remaining seeds
+        if not self.is_terminal():
+            return False
+        self.finalize()
+        return True
+
+    def side(self, player):
+        # Board side (1 for A-F, 2 for G-L) played by player 1 (computer) or -1
+        return 1 if self.playerSide[player] in PLAYER1_PITS else 2
+
+    def doMove(self, pit):
+        """Play a pit (letter or slot index) in place and return an undo record
+
+        The record is (seeds before the move, extra turn, game over, hash
+        before the move, per-side pit seeds and filled pits before the move).
+        The move includes the capture but not the end-of-game sweep, which
+        only finalize() does; undoMove restores the position.
+        """
+        state = self.state
+        before = bytes(state.seeds)
+        hash_before = state.hash
+        pit_seeds, filled = state.pit_seeds[:], state.filled[:]
+        extra_turn = state.sow(PIT_SLOTS[pit] if isinstance(pit, str) else pit)
+        return before, extra_turn, self.is_terminal(), hash_before, pit_seeds, filled
+
+    def undoMove(self, record):
+        # Restore the exact position saved by doMove
+        state = self.state
+        state.seeds[:] = record[0]
+        state.hash = record[3]
+        state.pit_seeds = record[4]
+        state.filled = record[5]
+    
+    def findWinner(self):
+        player1_score = self.state.board[1]
+        player2_score = self.state.board[2]
+        
+        if player1_score > player2_score:
+            return 'Player 1', player1_score
+        elif player2_score > player1_score:
+            return 'Player 2', player2_score
+        else:
+            return 'Tie', player1_score
+    
+    def evaluate_ai1(self):
+        # Original heuristic: Difference in store seeds
+        seeds = self.state.seeds
+        return self.perspective * (seeds[STORE1] - seeds[STORE2])
+    
+    def evaluate_ai2(self):
+        # Advanced heuristic: Consider store, pit distribution, and potential moves
+        state = self.state
+        seeds = state.seeds
+        store_diff = seeds[STORE1] - seeds[STORE2]
+        
+        # Bonus for more potential moves (non-empty pits, kept by the board)
+        filled = state.filled
+        moves_diff = filled[1] - filled[2]
+        
+        # Bonus for pit distribution 
+        pit_seeds = state.pit_seeds
+        distribution_bonus = pit_seeds[1] - pit_seeds[2]
+        
+        return self.perspective * (store_diff + 0.5 * moves_diff + 0.3 * distribution_bonus)
+
+# Width of the PVS null window; heuristic scores move in steps of 0.1
+NULL_WINDOW = 1e-6
+# Half-width of the aspiration window around the previous iteration's score
+ASPIRATION_WINDOW = 1.0
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the move's time budget runs out"""
+
+
+class SearchCancelled(Exception):
+    """Raised out of Play.search when Play.stop is set (see background_search)"""
+
+
+class SearchResult:
+    """One root search: the move to play and how it was found
+
+    `score` is from the computer's side, `pv` lists the pits the search
+    expects next (extra turns included), `depth` is the deepest completed
+    iteration and `nodes` the positions visited. `source` is 'search' or 'book'.
+    """
+
+    def __init__(self, move, score, pv, depth, nodes, extra_turn=False, source='search'):
+        self.move = move
+        self.score = score
+        self.pv = pv
+        self.depth = depth
+        self.nodes = nodes
+        self.extra_turn = extra_turn
+        self.source = source
+
+    def __repr__(self):
+        return (f"SearchResult(move={self.move!r}, score={self.score}, pv={self.pv}, "
+                f"depth={self.depth}, nodes={self.nodes}, source={self.source!r})")
+
+
+class Play:
+    def __init__(self, ai1_side='A', ai2_side='G', human_side=None, ai1_depth=None, ai2_depth=None,
+                 tt_size_mb=16, time_budget=0.2, max_depth=30, move_ordering=True, workers=1,
+                 endgame_db=None, opening_book=None, batch_leaves=False, stats=None):
+        self.game_ai1 = Game(human_side=ai2_side, computer_side=ai1_side)
+        self.game_ai2 = Game(human_side=ai1_side, computer_side=ai2_side)
+        # Both AIs play on the same board
+        self.game_ai2.state = self.game_ai1.state
+        self.human_side = human_side
+        # A fixed depth per AI, or None to deepen until time_budget (seconds) runs out
+        self.ai1_depth = ai1_depth
+        self.ai2_depth = ai2_depth
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.deadline = None
+        self.nodes = 0
+        # Deepest iteration finished by the last iterative deepening
+        self.completed_depth = 0
+        # Set from another thread to abandon the running search
+        self.stop = False
+        # Called as progress(depth, score, pit, nodes) after each completed iteration
+        self.progress = None
+        # Optional SearchStats collector (search_stats.py); None skips all counting
+        self.stats = stats
+        # One transposition table per AI, created on first use
+        self.tt_size_mb = tt_size_mb
+        self.tables = {}
+        # Killer/history move ordering (off: plain pit order after the table move)
+        self.ordering = MoveOrderer() if move_ordering else None
+        # More than one worker splits the root moves over a process pool
+        self.workers = workers
+        self.parallel = None
+        # Exact endgame values from a file written by endgame_db.py
+        self.endgame_path = endgame_db
+        self.endgame = None
+        if endgame_db:
+            from .endgame_db import EndgameDB
+            self.endgame = EndgameDB(endgame_db)
+        # Precomputed opening moves from opening_book.py, read on first lookup
+        self.book = None
+        if opening_book:
+            from .opening_book import OpeningBook
+            self.book = OpeningBook(opening_book)
+        # Score depth-1 nodes' children with one numpy call instead of one by one
+        self.batch_leaves = batch_leaves
+        if batch_leaves:
+            from . import batch_eval
+            batch_eval._require_numpy()
+    
+    def table(self, game, ai_type):
+        """Transposition table for one AI (scores depend on heuristic and side)"""
+        key = (ai_type, game.perspective)
+        if key not in self.tables:
+            self.tables[key] = TranspositionTable(self.tt_size_mb)
+        return self.tables[key]
+
+    def tt_stats(self):
+        # Hit/miss/collision counters of every table, keyed by AI
+        return {ai_type: table.stats() for (ai_type, _), table in self.tables.items()}
+
+    def MinimaxAlphaBetaPruning(self, game, player, depth, alpha, beta, ai_type='ai1', ply=0):
+        """Best (value, pit) for `player` (1: computer, -1: opponent)
+
+        Values are from the computer's point of view, as before; the work is
+        done by the negamax core, which scores from the side to move.
+        """
+        if player == 1:
+            value, slot = self.negamax(game, game.side(1), depth, alpha, beta, ai_type, ply)
+        else:
+            value, slot = self.negamax(game, game.side(-1), depth, -beta, -alpha, ai_type, ply)
+            value = -value
+        return value, SLOT_KEYS[slot] if slot is not None else None
+
+    def negamax(self, game, side, depth, alpha, beta, ai_type='ai1', ply=0):
+        """Principal variation search; returns (score for `side`, best slot)
+
+        Searches a single mutable game: every move is undone before trying the
+        next. An extra turn keeps the same side to move, so that child's score
+        is used as is instead of negated.
+        """
+        self.nodes += 1
+        if not self.nodes & 1023:
+            if self.stop:
+                raise SearchCancelled
+            if self.deadline is not None and time.perf_counter() > self.deadline:
+                raise SearchTimeout
+        stats = self.stats
+        if stats is not None:
+            stats.nodes[ply] += 1
+
+        state = game.state
+        if game.is_terminal():
+            # Finished: the exact result, read without sweeping the board
+            if stats is not None:
+                stats.leaves += 1
+            value = game.final_score()
+            return (value if side == game.side(1) else -value), None
+
+        # Few seeds left: the endgame database knows the final margin, also at the horizon
+        if ply and self.endgame is not None:
+            pit_seeds = state.pit_seeds
+            margin = self.endgame.probe(state.seeds, side, pit_seeds[1] + pit_seeds[2])
+            if margin is not None:
+                seeds = state.seeds
+                return seeds[STORE_SLOT[side]] - seeds[STORE_SLOT[3 - side]] + margin, None
+
+        if depth == 0:
+            if stats is not None:
+                stats.leaves += 1
+            value = game.evaluate_ai1() if ai_type == 'ai1' else game.evaluate_ai2()
+            return (value if side == game.side(1) else -value), None
+
+        # Reuse earlier results for this position and side to move
+        table = self.table(game, ai_type)
+        key = position_key(state, side)
+        entry = table.probe(key)
+        alpha_start, beta_start = alpha, beta
+        tt_slot = None
+        if entry is not None:
+            _, entry_depth, bound, score, tt_slot, _ = entry
+            if entry_depth >= depth:
+                if bound == EXACT:
+                    return score, tt_slot
+                if bound == LOWER:
+                    alpha = max(alpha, score)
+                else:
+                    beta = min(beta, score)
+                if beta <= alpha:
+                    return score, tt_slot
+
+        # Frontier node: every child is a leaf, so score them all in one batch
+        if depth == 1 and self.batch_leaves and self.endgame is None:
+            value, slot = self.batched_frontier(game, side, ai_type)
+            table.store(key, depth, EXACT, value, slot)
+            return value, slot
+
+        # Stored best move first, then extra turns, captures, killers and history
+        moves = state.legal_slots(side)
+        ordering = self.ordering
+        if ordering is not None:
+            moves = ordering.order(state, moves, ply, tt_slot)
+        elif tt_slot in moves:
+            moves.remove(tt_slot)
+            moves.insert(0, tt_slot)
+
+        best_value = -math.inf
+        best_slot = None
+        for slot in moves:
+            record = game.doMove(slot)
+            if stats is not None:
+                stats.move(ply, record[1])
+            if record[1]:
+                # Extra turn: same side moves again, same window, no negation
+                if best_slot is None:
+                    value = self.negamax(game, side, depth-1, alpha, beta, ai_type, ply+1)[0]
+                else:
+                    value = self.negamax(game, side, depth-1, alpha, alpha + NULL_WINDOW, ai_type, ply+1)[0]
+                    if alpha < value < beta:
+                        value = self.negamax(game, side, depth-1, alpha, beta, ai_type, ply+1)[0]
+            else:
+                other = 3 - side
+                if best_slot is None:
+                    value = -self.negamax(game, other, depth-1, -beta, -alpha, ai_type, ply+1)[0]
+                else:
+                    # Null-window probe: only re-search if the move beats alpha
+                    value = -self.negamax(game, other, depth-1, -alpha - NULL_WINDOW, -alpha, ai_type, ply+1)[0]
+                    if alpha < value < beta:
+                        value = -self.negamax(game, other, depth-1, -beta, -alpha, ai_type, ply+1)[0]
+            game.undoMove(record)
+
+            if value > best_value:
+                best_value = value
+                best_slot = slot
+                if value > alpha:
+                    alpha = value
+                    if alpha >= beta:
+                        if ordering is not None:
+                            ordering.cutoff(slot, ply, depth)
+                        if stats is not None:
+                            stats.cutoff(ply, slot == moves[0])
+                        break
+
+        if best_value <= alpha_start:
+            bound = UPPER
+        elif best_value >= beta_start:
+            bound = LOWER
+        else:
+            bound = EXACT
+        table.store(key, depth, bound, best_value, best_slot)
+        return best_value, best_slot
+    
+    def batched_frontier(self, game, side, ai_type):
+        """Best (score, slot) of a depth-1 node from one vectorized leaf evaluation"""
+        from .batch_eval import evaluate_ai1_batch, evaluate_ai2_batch, positions_array
+
+        moves = game.state.legal_slots(side)
+        children = []
+        for slot in moves:
+            record = game.doMove(slot)
+            if record[2]:
+                # Swept, a finished board scores its exact result under both heuristics
+                game.finalize()
+            children.append(bytes(game.state.seeds))
+            game.undoMove(record)
+        self.nodes += len(moves)
+        if self.stats is not None:
+            self.stats.leaves += len(moves)
+
+        # A leaf is worth the same to this node whether or not the move gave an extra turn
+        evaluate = evaluate_ai1_batch if ai_type == 'ai1' else evaluate_ai2_batch
+        perspective = game.perspective if side == game.side(1) else -game.perspective
+        scores = evaluate(positions_array(children), perspective)
+        best = int(scores.argmax())
+        return float(scores[best]), moves[best]
+
+    def iterative_deepening(self, game, ai_type='ai1', time_budget=None, max_depth=None):
+        """Search one ply deeper at a time until the time budget runs out
+
+        Returns (value, pit) from the deepest completed iteration. Each
+        iteration starts from the previous best move, which the transposition
+        table hands back at the root, and searches a narrow aspiration window
+        around the previous score first. Depth 1 always completes.
+        """
+        time_budget = self.time_budget if time_budget is None else time_budget
+        max_depth = self.max_depth if max_depth is None else max_depth
+        state = game.state
+        root = state.snapshot()
+        start = time.perf_counter()
+        best = None
+
+        for depth in range(1, max_depth + 1):
+            self.deadline = start + time_budget if best is not None else None
+            iteration_start, iteration_nodes = time.perf_counter(), self.nodes
+            try:
+                best = self.aspiration_search(game, depth, ai_type, best[0] if best else None)
+            except SearchTimeout:
+                # Unwound mid-move: put the root position back
+                state.restore(root)
+                break
+            self.completed_depth = depth
+            if self.stats is not None:
+                self.stats.iteration(depth, self.nodes - iteration_nodes,
+                                     time.perf_counter() - iteration_start)
+            if self.progress is not None:
+                self.progress(depth, best[0], best[1], self.nodes)
+            if best[1] is None or time.perf_counter() - start >= time_budget:
+                break
+
+        self.deadline = None
+        return best
+
+    def aspiration_search(self, game, depth, ai_type, guess=None):
+        # Root search in a window around `guess`, widened on each fail-low/high
+        if guess is None:
+            return self.MinimaxAlphaBetaPruning(game, 1, depth, -math.inf, math.inf, ai_type)
+        window = ASPIRATION_WINDOW
+        while True:
+            alpha, beta = guess - window, guess + window
+            if window > 4 * ASPIRATION_WINDOW:
+                alpha, beta = -math.inf, math.inf
+            value, pit = self.MinimaxAlphaBetaPruning(game, 1, depth, alpha, beta, ai_type)
+            if alpha < value < beta:
+                return value, pit
+            window *= 4
+
+    def parallel_search(self):
+        """Process pool for root-parallel search, started on first use"""
+        if self.parallel is None:
+            from .parallel_search import ParallelSearch
+            self.parallel = ParallelSearch(self.workers, self.tt_size_mb, self.endgame_path)
+        return self.parallel
+
+    def close(self):
+        # Shut down the worker pool, if one was started
+        if self.parallel is not None:
+            self.parallel.close()
+            self.parallel = None
+
+    def book_move(self, game, ai_type):
+        # (score, pit) from the opening book, or None when the position isn't in it.
+        # A book only answers for the heuristic it was built with
+        if self.book is None or not self.book.covers(ai_type):
+            return None
+        side = game.side(1)
+        entry = self.book.probe(position_key(game.state, side))
+        if entry is None or not game.state.seeds[entry[0]] or SLOT_SIDE[entry[0]] != side:
+            return None
+        return entry[1], SLOT_KEYS[entry[0]]
+
+    def search(self, game, ai_type, depth=None):
+        """SearchResult for the computer of `game`
+
+        Book move if there is one; else fixed-depth search when a depth is
+        given, otherwise time-budgeted deepening.
+        """
+        stats = self.stats
+        if stats is not None:
+            stats.begin()
+        book = self.book_move(game, ai_type)
+        if book is not None:
+            slot = PIT_SLOTS[book[1]]
+            result = SearchResult(book[1], book[0], [book[1]], self.book.depth, 0,
+                                  game.state.is_extra_turn(slot), source='book')
+            if stats is not None:
+                stats.finish(result, ai_type, 0)
+            return result
+
+        self.table(game, ai_type).new_search()
+        if self.ordering is not None:
+            self.ordering.new_search()
+        nodes_before = self.nodes
+        root = game.state.snapshot()
+        try:
+            if self.workers > 1:
+                if depth is None:
+                    score, move = self.parallel_search().iterative_deepening(
+                        self, game, ai_type, self.time_budget, self.max_depth)
+                    reached = self.completed_depth
+                else:
+                    score, move = self.parallel_search().search(self, game, depth, ai_type)
+                    reached = depth
+            elif depth is None:
+                score, move = self.iterative_deepening(game, ai_type)
+                reached = self.completed_depth
+            else:
+                score, move = self.MinimaxAlphaBetaPruning(
+                    game, 1, depth=depth, alpha=-math.inf, beta=math.inf, ai_type=ai_type
+                )
+                reached = depth
+                if stats is not None:
+                    stats.iteration(depth, self.nodes - nodes_before, time.perf_counter() - stats.start)
+        except SearchCancelled:
+            # Abandoned mid-move: put the root position back
+            game.state.restore(root)
+            self.deadline = None
+            raise
+
+        if move is None:
+            result = SearchResult(None, score, [], reached, self.nodes - nodes_before)
+        else:
+            pv = self.principal_variation(game, ai_type, reached)
+            if not pv or pv[0] != move:
+                # The table no longer holds this root (e.g. it was searched in worker processes)
+                pv = [move]
+            result = SearchResult(move, score, pv, reached, self.nodes - nodes_before,
+                                  game.state.is_extra_turn(PIT_SLOTS[move]))
+        if stats is not None:
+            stats.finish(result, ai_type, result.nodes)
+        return result
+
+    def principal_variation(self, game, ai_type, max_length):
+        # Follow the table's best moves from the root, then take them back
+        table = self.table(game, ai_type)
+        side = game.side(1)
+        pv, records, seen = [], [], set()
+        while len(pv) < max_length:
+            key = position_key(game.state, side)
+            slot = table.best_slot(key)
+            if slot is None or key in seen or SLOT_SIDE[slot] != side or not game.state.seeds[slot]:
+                break
+            seen.add(key)
+            pv.append(SLOT_KEYS[slot])
+            record = game.doMove(slot)
+            records.append(record)
+            if record[2]:
+                break
+            if not record[1]:
+                side = 3 - side
+        for record in reversed(records):
+            game.undoMove(record)
+        return pv
+
+    def best_move(self, game, ai_type, depth=None):
+        # (score, pit) of search(), for callers that only need the move
+        result = self.search(game, ai_type, depth)
+        return result.score, result.move
+
+    def play_result(self, game, result):
+        """Play a SearchResult's move on the shared board; returns True on an extra turn"""
+        return game.state.sow(PIT_SLOTS[result.move])
+
+    def ai1_turn(self):
+        # AI 1 using original heuristic: one search, then its move is played
+        result = self.search(self.game_ai1, 'ai1', self.ai1_depth)
+        print(f"\nAI 1 chooses pit: {result.move}")
+        self.play_result(self.game_ai1, result)
+        return result
+
+    def ai2_turn(self):
+        # AI 2 using advanced heuristic
+        result = self.search(self.game_ai2, 'ai2', self.ai2_depth)
+        print(f"\nAI 2 chooses pit: {result.move}")
+        self.play_result(self.game_ai2, result)
+        return result
+    
+    def printBoard(self, game):
+        board = game.state.board
+        print("\n    L  K  J  I  H  G")
+        print("    {} {} {} {} {} {}".format(
+            board['L'], board['K'], board['J'], board['I'], board['H'], board['G']))
+        print("{}                    {}".format(board[2], board[1]))
+        print("    {} {} {} {} {} {}".format(
+            board['A'], board['B'], board['C'], board['D'], board['E'], board['F']))
+        print("    A  B  C  D  E  F")
+    
+    def play_ai_vs_ai(self):
+        print("Welcome to Mancala AI vs AI Game!")
+        current_game = self.game_ai1  # Start with AI1's game
+        ai_turn = 1  # 1 for AI1, -1 for AI2
+        
+        while not self.game_ai1.gameOver():
+            # Alternate between AI1 and AI2
+            if ai_turn == 1:
+                self.printBoard(self.game_ai1)
+                result = self.ai1_turn()
+                # Last seed in AI1's store: AI1 moves again
+                ai_turn = 1 if result.extra_turn else -1
+            else:
+                self.printBoard(self.game_ai2)
+                result = self.ai2_turn()
+                ai_turn = -1 if result.extra_turn else 1
+        
+        # Determine the winner based on AI1's game (both games share the same board)
+        winner, score = self.game_ai1.findWinner()
+        print(f"\nGame Over! {winner} wins with {score} seeds.")
+
+if __name__ == "__main__":
+    game = Play()
+    game.play_ai_vs_ai()
\ No newline at end of file
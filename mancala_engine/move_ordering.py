@@ -0,0 +1,56 @@
+# Sort keys: each class of move outranks everything below it
+TT_MOVE = 1 << 30
+EXTRA_TURN = 1 << 28
+CAPTURE = 1 << 26
+KILLER = 1 << 24
+
+
+class MoveOrderer:
+    """Orders moves so alpha-beta meets its cutoffs early
+
+    Order: the transposition-table move, moves ending in the mover's store
+    (extra turn), captures (bigger first), the two killer moves of this ply,
+    then the rest by history score. Extra turns and captures are read off the
+    board without playing the move.
+    """
+
+    def __init__(self, max_ply=128):
+        self.max_ply = max_ply
+        self.killers = [[None, None] for _ in range(max_ply)]
+        # history[slot]: sum of depth * depth over the cutoffs the move caused
+        self.history = [0] * 14
+
+    def new_search(self):
+        # Killers are position-specific; history fades instead of resetting
+        for killers in self.killers:
+            killers[0] = killers[1] = None
+        self.history = [score >> 1 for score in self.history]
+
+    def order(self, board, moves, ply, tt_slot=None):
+        if len(moves) < 2:
+            return moves
+        killers = self.killers[ply] if ply < self.max_ply else (None, None)
+        history = self.history
+
+        def score(slot):
+            if slot == tt_slot:
+                return TT_MOVE
+            if board.is_extra_turn(slot):
+                return EXTRA_TURN
+            captured = board.captured_seeds(slot)
+            if captured:
+                return CAPTURE + captured
+            if slot == killers[0] or slot == killers[1]:
+                return KILLER
+            return history[slot]
+
+        return sorted(moves, key=score, reverse=True)
+
+    def cutoff(self, slot, ply, depth):
+        # Remember a move that caused a beta cutoff
+        if ply < self.max_ply:
+            killers = self.killers[ply]
+            if killers[0] != slot:
+                killers[1] = killers[0]
+                killers[0] = slot
+        self.history[slot] += depth * depth
@@ -0,0 +1,129 @@
+import argparse
+import mmap
+import struct
+import time
+
+from .mancala_game import MancalaBoard, Play, SLOT_KEYS, PACKED_SIDE_SHIFT
+from .transposition import position_key
+
+# File layout: header, then records sorted by position key
+MAGIC = b'MNCLBOOK'
+HEADER = struct.Struct('<8sI3sB')  # magic, record count, heuristic, search depth
+RECORD = struct.Struct('<QBh')     # position key, best slot, score * 10
+
+
+def opening_positions(plies):
+    """Every packed position reachable in fewer than `plies` moves from the start
+
+    Extra turns count as plies, as in the search. Finished games are left out.
+    """
+    frontier = {MancalaBoard().pack(1)}
+    seen = set(frontier)
+    for _ in range(plies - 1):
+        next_frontier = set()
+        for packed in frontier:
+            board, side = MancalaBoard.unpack(packed)
+            for slot in board.legal_slots(side):
+                child = board.copy()
+                next_side = side if child.sow(slot) else 3 - side
+                if not child.legal_slots(1) or not child.legal_slots(2):
+                    continue
+                position = child.pack(next_side)
+                if position not in seen:
+                    seen.add(position)
+                    next_frontier.add(position)
+        frontier = next_frontier
+    return sorted(seen)
+
+
+_builder = None
+
+
+def _search_position(position, depth, ai_type):
+    # Worker: deep fixed-depth search of one packed book position
+    global _builder
+    if _builder is None:
+        _builder = Play(tt_size_mb=64)
+    side = (position >> PACKED_SIDE_SHIFT) + 1
+    game = _builder.game_ai1 if side == 1 else _builder.game_ai2
+    state = game.state
+    state.load(position)
+    value, pit = _builder.best_move(game, ai_type, depth)
+    return position_key(state, side), SLOT_KEYS.index(pit), value
+
+
+def build(path, plies=4, depth=8, ai_type='ai2', workers=None, verbose=False):
+    """Search every position of the first `plies` plies to `depth` and write the book"""
+    # Imported here so that loading a book for lookups stays cheap
+    from concurrent.futures import ProcessPoolExecutor
+
+    positions = opening_positions(plies)
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        records = list(pool.map(
+            _search_position, positions, [depth] * len(positions), [ai_type] * len(positions),
+            chunksize=8
+        ))
+    records.sort()
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, len(records), ai_type.encode(), depth))
+        for key, slot, value in records:
+            f.write(RECORD.pack(key, slot, round(value * 10)))
+    if verbose:
+        print(f"{len(records)} positions searched to depth {depth} in {time.perf_counter() - start:.1f}s")
+    return len(records)
+
+
+class OpeningBook:
+    """Best moves for opening positions; the file is only opened on the first probe"""
+
+    def __init__(self, path):
+        self.path = path
+        self.data = None
+        self.count = 0
+        self.hits = self.misses = 0
+
+    def _load(self):
+        with open(self.path, 'rb') as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count, heuristic, self.depth = HEADER.unpack_from(self.data)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not an opening book")
+        self.heuristic = heuristic.decode()
+
+    def covers(self, ai_type):
+        """True if the book was built with the heuristic `ai_type`"""
+        if self.data is None:
+            self._load()
+        return self.heuristic == ai_type
+
+    def probe(self, key):
+        """(best slot, score) for a position key, or None if the book doesn't have it"""
+        if self.data is None:
+            self._load()
+        # Binary search over the sorted, fixed-size records
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            record_key, slot, score = RECORD.unpack_from(self.data, HEADER.size + middle * RECORD.size)
+            if record_key == key:
+                self.hits += 1
+                return slot, score / 10
+            if record_key < key:
+                low = middle + 1
+            else:
+                high = middle
+        self.misses += 1
+        return None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the Mancala opening book")
+    parser.add_argument("--plies", type=int, default=4, help="opening plies to cover (default: 4)")
+    parser.add_argument("--depth", type=int, default=8, help="search depth per position (default: 8)")
+    parser.add_argument("--heuristic", default="ai2", choices=["ai1", "ai2"])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--out", default="opening_book.bin")
+    args = parser.parse_args()
+
+    build(args.out, args.plies, args.depth, args.heuristic, args.workers, verbose=True)
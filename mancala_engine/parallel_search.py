@@ -0,0 +1,154 @@
+import math
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from .mancala_game import Play, SearchCancelled, SearchTimeout, SLOT_KEYS, PLAYER1_PITS
+
+# Per-process state, set up by _init_worker
+_worker_play = None
+_best_value = None
+_best_index = None
+
+
+def _init_worker(best_value, best_index, tt_size_mb, endgame_path):
+    global _worker_play, _best_value, _best_index
+    _worker_play = Play(tt_size_mb=tt_size_mb, endgame_db=endgame_path)
+    _best_value = best_value
+    _best_index = best_index
+
+
+def _search_root_move(position, computer_side, ai_type, slot, depth, index, deadline):
+    """Search one root move in a worker; returns (index, value, exact, nodes) or None on timeout
+
+    `deadline` is a time.monotonic() value (or None), so a move that waited
+    in the queue gets only what is left of the budget, not a fresh one.
+
+    The window's lower bound is the best root value found so far by any
+    worker. A move listed earlier than the current best only has to tie it,
+    a later one has to beat it, so ties go to the move the serial search
+    would have kept. Values at or below the bound are upper bounds (exact=False).
+    """
+    play = _worker_play
+    if deadline is not None:
+        time_left = deadline - time.monotonic()
+        if time_left <= 0:
+            return None
+        # negamax checks its deadline against perf_counter
+        play.deadline = time.perf_counter() + time_left
+    game = play.game_ai1 if computer_side in PLAYER1_PITS else play.game_ai2
+    side = game.state.load(position)
+
+    with _best_value.get_lock():
+        bound, bound_index = _best_value.value, _best_index.value
+    alpha = bound if bound_index < index else math.nextafter(bound, -math.inf)
+
+    play.table(game, ai_type).new_search()
+    nodes_before = play.nodes
+    record = game.doMove(slot)
+    try:
+        if record[1]:
+            value = play.negamax(game, side, depth - 1, alpha, math.inf, ai_type, 1)[0]
+        else:
+            value = -play.negamax(game, 3 - side, depth - 1, -math.inf, -alpha, ai_type, 1)[0]
+    except SearchTimeout:
+        return None
+    finally:
+        play.deadline = None
+
+    exact = value > alpha
+    if exact:
+        with _best_value.get_lock():
+            if value > _best_value.value or (value == _best_value.value and index < _best_index.value):
+                _best_value.value = value
+                _best_index.value = index
+    return index, value, exact, play.nodes - nodes_before
+
+
+class ParallelSearch:
+    """Root-split search: the root moves (at most 6) are spread over a process pool
+
+    The first root move is searched alone, then the rest run concurrently and
+    each starts from the best bound found so far. For a given depth the chosen
+    move matches Play.MinimaxAlphaBetaPruning's on the same root move order.
+    """
+
+    def __init__(self, workers=None, tt_size_mb=16, endgame_path=None):
+        self.workers = workers or multiprocessing.cpu_count()
+        self.best_value = multiprocessing.Value('d', -math.inf)
+        self.best_index = multiprocessing.Value('i', 0)
+        self.pool = ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_init_worker,
+            initargs=(self.best_value, self.best_index, tt_size_mb, endgame_path)
+        )
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+    def search(self, play, game, depth, ai_type='ai1', time_left=None):
+        """Fixed-depth root-parallel search; returns (value, pit) or None on timeout"""
+        state = game.state
+        if game.is_terminal() or depth == 0:
+            return play.MinimaxAlphaBetaPruning(game, 1, 0, -math.inf, math.inf, ai_type)
+
+        # Same root order as the serial search would use on this Play
+        moves = state.legal_slots(game.side(1))
+        if play.ordering is not None:
+            moves = play.ordering.order(state, moves, 0)
+
+        with self.best_value.get_lock():
+            self.best_value.value = -math.inf
+            self.best_index.value = len(moves)
+
+        # The root crosses to the workers as one packed int
+        position = state.pack(game.side(1))
+        deadline = time.monotonic() + time_left if time_left is not None else None
+
+        def submit(index):
+            return self.pool.submit(_search_root_move, position, game.playerSide[1], ai_type,
+                                    moves[index], depth, index, deadline)
+
+        # Search the first move alone so the others start with a real bound
+        results = [submit(0).result()]
+        pending = {submit(index) for index in range(1, len(moves))}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            results.extend(future.result() for future in done)
+
+        if any(result is None for result in results):
+            return None
+        play.nodes += sum(result[3] for result in results)
+        best_index, best_value = min(
+            ((index, value) for index, value, exact, _ in results if exact),
+            key=lambda item: (-item[1], item[0])
+        )
+        return best_value, SLOT_KEYS[moves[best_index]]
+
+    def iterative_deepening(self, play, game, ai_type='ai1', time_budget=0.2, max_depth=30):
+        # Deepen one ply at a time; keep the deepest depth that finished in time
+        start, start_nodes = time.perf_counter(), play.nodes
+        best = self.search(play, game, 1, ai_type)
+        play.completed_depth = 1
+        if play.stats is not None:
+            play.stats.iteration(1, play.nodes - start_nodes, time.perf_counter() - start)
+        if play.progress is not None:
+            play.progress(1, best[0], best[1], play.nodes)
+        for depth in range(2, max_depth + 1):
+            # Workers can't see Play.stop, so a cancel lands between iterations
+            if play.stop:
+                raise SearchCancelled
+            time_left = time_budget - (time.perf_counter() - start)
+            if time_left <= 0:
+                break
+            iteration_start, iteration_nodes = time.perf_counter(), play.nodes
+            result = self.search(play, game, depth, ai_type, time_left)
+            if result is None:
+                break
+            best = result
+            play.completed_depth = depth
+            if play.stats is not None:
+                play.stats.iteration(depth, play.nodes - iteration_nodes,
+                                     time.perf_counter() - iteration_start)
+            if play.progress is not None:
+                play.progress(depth, best[0], best[1], play.nodes)
+        return best
@@ -0,0 +1,101 @@
+import json
+import time
+
+
+class SearchStats:
+    """Counters for what the search did on each move
+
+    Pass one to Play(stats=...); without it the search skips every counter.
+    Play.search calls begin() and finish() around each move; `last` then
+    holds that move's record (see record()), which is also appended to
+    `out_path` as one JSON line when a path is given.
+
+    Per-ply counters come from the negamax loop, so they cover the serial
+    search only. Root-parallel searches report nodes and iteration times.
+    """
+
+    def __init__(self, out_path=None, max_ply=128):
+        self.out_path = out_path
+        self.out = None
+        self.max_ply = max_ply
+        self.last = None
+        self.moves = 0
+        self.begin()
+
+    def begin(self):
+        # Reset the per-move counters
+        self.nodes = [0] * self.max_ply
+        self.leaves = 0
+        self.cutoffs = [0] * self.max_ply
+        self.first_cutoffs = 0
+        # chain[ply]: extra turns already taken in the turn being searched at ply
+        self.chain = [0] * (self.max_ply + 1)
+        self.chains = {}
+        self.iterations = []
+        self.start = time.perf_counter()
+
+    def move(self, ply, extra_turn):
+        # A move made at `ply`; a move that passes the turn ends its chain
+        chain = self.chain[ply]
+        if extra_turn:
+            self.chain[ply + 1] = chain + 1
+        else:
+            self.chain[ply + 1] = 0
+            self.chains[chain] = self.chains.get(chain, 0) + 1
+
+    def cutoff(self, ply, first_move):
+        self.cutoffs[ply] += 1
+        if first_move:
+            self.first_cutoffs += 1
+
+    def iteration(self, depth, nodes, seconds):
+        self.iterations.append({'depth': depth, 'nodes': nodes, 'time': seconds})
+
+    def branching_factor(self):
+        """Effective branching factor: node growth per extra ply across the iterations"""
+        grown = [i for i in self.iterations if i['nodes']]
+        if len(grown) < 2 or grown[-1]['depth'] == grown[0]['depth']:
+            return None
+        first, last = grown[0], grown[-1]
+        return (last['nodes'] / first['nodes']) ** (1 / (last['depth'] - first['depth']))
+
+    def record(self, result=None, ai_type=None, nodes=None):
+        """This move's counters as a JSON-ready dict"""
+        elapsed = time.perf_counter() - self.start
+        searched = sum(self.nodes)
+        nodes = searched if nodes is None else nodes
+        cutoffs = sum(self.cutoffs)
+        used = max((ply for ply, count in enumerate(self.nodes) if count), default=-1) + 1
+        return {
+            'move': result.move if result is not None else None,
+            'score': result.score if result is not None else None,
+            'depth': result.depth if result is not None else None,
+            'source': result.source if result is not None else None,
+            'heuristic': ai_type,
+            'nodes': nodes,
+            'leaves': self.leaves,
+            'time': elapsed,
+            'nps': nodes / elapsed if elapsed > 0 else 0.0,
+            'nodes_per_ply': self.nodes[:used],
+            'cutoffs_per_ply': self.cutoffs[:used],
+            'first_move_cutoff_rate': self.first_cutoffs / cutoffs if cutoffs else None,
+            'branching_factor': self.branching_factor(),
+            'extra_turn_chains': {str(length): count for length, count in sorted(self.chains.items())},
+            'iterations': self.iterations,
+        }
+
+    def finish(self, result=None, ai_type=None, nodes=None):
+        # Close the move: keep its record and log it
+        self.last = self.record(result, ai_type, nodes)
+        self.moves += 1
+        if self.out_path:
+            if self.out is None:
+                self.out = open(self.out_path, 'a')
+            self.out.write(json.dumps(self.last) + '\n')
+            self.out.flush()
+        return self.last
+
+    def close(self):
+        if self.out is not None:
+            self.out.close()
+            self.out = None
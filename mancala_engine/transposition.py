@@ -0,0 +1,96 @@
+import random
+
+# Most seeds a single slot can ever hold (4 seeds in each of the 12 pits)
+MAX_SEEDS = 48
+
+# Zobrist keys: one random 64-bit number per (slot, seed count), plus one for
+# "side 2 to move". A fixed seed keeps hashes identical across processes/runs.
+_rng = random.Random(0x4D414E43)
+ZOBRIST = [[_rng.getrandbits(64) for _ in range(MAX_SEEDS + 1)] for _ in range(14)]
+ZOBRIST_SIDE = _rng.getrandbits(64)
+
+# ZOBRIST_STEP[slot][n] flips a slot's hash from n to n + 1 seeds
+ZOBRIST_STEP = [[keys[n] ^ keys[n + 1] for n in range(MAX_SEEDS)] + [0] for keys in ZOBRIST]
+
+# Bound types stored with each score
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+def zobrist_hash(seeds):
+    """Hash a 14-slot board from scratch (the board keeps it up to date incrementally)"""
+    h = 0
+    for slot, count in enumerate(seeds):
+        h ^= ZOBRIST[slot][count]
+    return h
+
+
+def position_key(board, side):
+    # Table key for a board with side 1 (A-F) or side 2 (G-L) to move
+    return board.hash ^ ZOBRIST_SIDE if side == 2 else board.hash
+
+
+class TranspositionTable:
+    """Fixed-size, depth-preferred table of search results keyed by Zobrist hash
+
+    Entries are (key, depth, bound, score, best slot, generation) tuples in a
+    power-of-two list, so memory stays within the budget however long it runs.
+    An entry is only replaced by a search at least as deep, unless it was left
+    over from an earlier move's search.
+    """
+
+    # Rough CPython footprint of one stored entry tuple and its values
+    ENTRY_BYTES = 160
+
+    def __init__(self, size_mb=16):
+        entries = max(1, int(size_mb * 1024 * 1024) // self.ENTRY_BYTES)
+        self.size = 1 << (entries.bit_length() - 1)
+        self.mask = self.size - 1
+        self.entries = [None] * self.size
+        self.generation = 0
+        self.hits = self.misses = self.collisions = self.stores = 0
+
+    def new_search(self):
+        # Age existing entries so the next search may overwrite them
+        self.generation += 1
+
+    def clear(self):
+        self.entries = [None] * self.size
+        self.generation = 0
+        self.hits = self.misses = self.collisions = self.stores = 0
+
+    def probe(self, key):
+        entry = self.entries[key & self.mask]
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry[0] != key:
+            # Slot taken by another position
+            self.collisions += 1
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def best_slot(self, key):
+        # Stored best move for a position, without counting it as a probe
+        entry = self.entries[key & self.mask]
+        return entry[4] if entry is not None and entry[0] == key else None
+
+    def store(self, key, depth, bound, score, best_slot):
+        index = key & self.mask
+        old = self.entries[index]
+        if (old is None or old[0] == key or depth >= old[1]
+                or old[5] != self.generation):
+            self.entries[index] = (key, depth, bound, score, best_slot, self.generation)
+            self.stores += 1
+
+    def stats(self):
+        probes = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'collisions': self.collisions,
+            'stores': self.stores,
+            'hit_rate': self.hits / probes if probes else 0.0,
+            'size': self.size,
+        }
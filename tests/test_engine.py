@@ -0,0 +1,163 @@
+"""Regression checks for the board's incremental bookkeeping and the endgame database
+
+Run from the repository root: python -m pytest tests (or python -m unittest discover tests)
+"""
+import os
+import random
+import tempfile
+import unittest
+from functools import lru_cache
+
+from mancala_engine import Game, MancalaBoard
+from mancala_engine.endgame_db import EndgameDB, build
+from mancala_engine.transposition import zobrist_hash
+
+
+def reference_sow(seeds, slot):
+    """The rules written out plainly: (slots after the move, extra turn, seeds captured)"""
+    seeds = list(seeds)
+    side = 1 if slot < 6 else 2
+    store, skip = (6, 13) if side == 1 else (13, 6)
+    count, seeds[slot] = seeds[slot], 0
+    current = slot
+    while count:
+        current = (current + 1) % 14
+        if current == skip:
+            continue
+        seeds[current] += 1
+        count -= 1
+
+    captured = 0
+    own_pit = current < 6 if side == 1 else 7 <= current < 13
+    if own_pit and seeds[current] == 1 and seeds[12 - current] > 0:
+        captured = seeds[12 - current]
+        seeds[store] += 1 + captured
+        seeds[current] = seeds[12 - current] = 0
+    return seeds, current == store, captured
+
+
+def random_slots(rng, total=48):
+    # 14 counts summing to total, often with a pit big enough to lap the board
+    cuts = sorted(rng.randint(0, total) for _ in range(13))
+    return [high - low for low, high in zip([0] + cuts, cuts + [total])]
+
+
+@lru_cache(maxsize=None)
+def solve(pits):
+    """Best final margin for the side to move, from 12 pits (mover's row first), by brute force"""
+    own, other = pits[:6], pits[6:]
+    if not any(own) or not any(other):
+        return sum(own) - sum(other)
+    best = None
+    for slot in range(6):
+        if not pits[slot]:
+            continue
+        seeds, extra_turn, _ = reference_sow(own + (0,) + other + (0,), slot)
+        gain, own_after, other_after = seeds[6], tuple(seeds[0:6]), tuple(seeds[7:13])
+        if not any(own_after) or not any(other_after):
+            value = gain + sum(own_after) - sum(other_after)
+        elif extra_turn:
+            value = gain + solve(own_after + other_after)
+        else:
+            value = gain - solve(other_after + own_after)
+        best = value if best is None else max(best, value)
+    return best
+
+
+def compositions(total, parts):
+    if parts == 1:
+        yield (total,)
+        return
+    for first in range(total + 1):
+        for rest in compositions(total - first, parts - 1):
+            yield (first,) + rest
+
+
+class BoardInvariantTest(unittest.TestCase):
+    """Every move on random boards against the reference rules and a full recount"""
+
+    POSITIONS = 3000
+
+    def assert_consistent(self, board):
+        seeds = board.seeds
+        self.assertEqual(board.hash, zobrist_hash(seeds))
+        self.assertEqual(board.pit_seeds, [0, sum(seeds[0:6]), sum(seeds[7:13])])
+        self.assertEqual(board.filled, [0, 6 - seeds[0:6].count(0), 6 - seeds[7:13].count(0)])
+
+    def test_moves_match_reference(self):
+        rng = random.Random(0)
+        game = Game()
+        for _ in range(self.POSITIONS):
+            slots = random_slots(rng)
+            game.state.seeds[:] = bytes(slots)
+            game.state.hash = zobrist_hash(game.state.seeds)
+            game.state.recount()
+            for side in (1, 2):
+                for slot in game.state.legal_slots(side):
+                    board = game.state
+                    expected, extra_turn, captured = reference_sow(slots, slot)
+                    landing = board.landing_slot(slot)
+                    self.assertEqual(bool(board.is_extra_turn(slot)), extra_turn)
+                    self.assertEqual(board.captured_seeds(slot), captured)
+
+                    record = game.doMove(slot)
+                    self.assertEqual(list(board.seeds), expected, (slots, slot))
+                    self.assertEqual(record[1], extra_turn)
+                    self.assertEqual(record[2], game.is_terminal())
+                    self.assert_consistent(board)
+                    if not captured:
+                        self.assertGreater(board.seeds[landing], 0)
+
+                    game.undoMove(record)
+                    self.assertEqual(list(board.seeds), slots)
+                    self.assert_consistent(board)
+
+    def test_final_score_matches_sweep(self):
+        rng = random.Random(1)
+        game = Game()
+        for _ in range(self.POSITIONS):
+            game.state = MancalaBoard()
+            side = 1
+            while not game.is_terminal():
+                if not game.state.sow(rng.choice(game.state.legal_slots(side))):
+                    side = 3 - side
+            margin = game.final_margin()
+            game.finalize()
+            self.assertEqual(game.state.seeds[6] - game.state.seeds[13], margin)
+            self.assert_consistent(game.state)
+
+
+class EndgameDBTest(unittest.TestCase):
+    """Every position of a small database against the brute-force solver, for both sides"""
+
+    MAX_SEEDS = 5
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        path = os.path.join(cls.directory.name, 'endgame.db')
+        build(cls.MAX_SEEDS, path)
+        cls.db = EndgameDB(path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.db.close()
+        cls.directory.cleanup()
+
+    def test_matches_brute_force(self):
+        for total in range(self.MAX_SEEDS + 1):
+            for pits in compositions(total, 12):
+                expected = solve(pits)
+                side1 = bytearray(pits[:6] + (0,) + pits[6:] + (0,))
+                side2 = bytearray(pits[6:] + (0,) + pits[:6] + (0,))
+                self.assertEqual(self.db.probe(side1, 1), expected, pits)
+                self.assertEqual(self.db.probe(side2, 2), expected, pits)
+                self.assertEqual(self.db.probe(side1, 1, total), expected, pits)
+
+    def test_out_of_range(self):
+        seeds = bytearray([1, 1, 1, 1, 1, 1, 0, 1, 0, 0, 0, 0, 0, 0])
+        self.assertIsNone(self.db.probe(seeds, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()